@@ -3,6 +3,8 @@
 # SPDX-License-Identifier: BSD-3-Clause
 """Tools for versioning."""
 
+import os.path
+
 
 def get_version():
     """Get Siphon's version.
@@ -10,14 +12,21 @@ def get_version():
     Either get it from package metadata, or get it using version control information if
     a development install.
     """
-    try:
-        from setuptools_scm import get_version as _get_version
-        return _get_version(root='../..', relative_to=__file__,
-                            version_scheme='post-release')
-    except (ImportError, LookupError):
-        from importlib.metadata import PackageNotFoundError, version
-
+    # Only consult version control when running from a source checkout; otherwise
+    # setuptools_scm would search (and possibly run git) on every import of an
+    # installed package, only to fail.
+    root = os.path.join(os.path.dirname(__file__), os.pardir, os.pardir)
+    if os.path.exists(os.path.join(root, '.git')):
         try:
-            return version(__package__)
-        except PackageNotFoundError:
-            return 'Unknown'
+            from setuptools_scm import get_version as _get_version
+            return _get_version(root='../..', relative_to=__file__,
+                                version_scheme='post-release')
+        except (ImportError, LookupError):
+            pass
+
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version(__package__)
+    except PackageNotFoundError:
+        return 'Unknown'
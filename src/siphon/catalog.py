@@ -7,10 +7,17 @@ Code to support reading and parsing catalog files from a THREDDS Data Server (TD
 They help identifying the latest dataset and finding proper URLs to access the data.
 """
 
+import bisect
 from collections import OrderedDict
+import contextlib
 from datetime import datetime
+import functools
+import itertools
 import logging
+import operator
+import os
 import re
+import shutil
 from urllib.parse import urljoin, urlparse
 import warnings
 import xml.etree.ElementTree as ET  # noqa:N814
@@ -21,18 +28,33 @@ from .metadata import TDSCatalogMetadata
 log = logging.getLogger(__name__)
 log.setLevel(logging.ERROR)
 
+# Lowercase service types, for case-insensitive comparisons against plain strings
+_COMPOUND_SERVICE = 'compound'
+_REMOTE_SERVICES = frozenset(('cdmremote', 'opendap', 'dods'))
+
 
 class IndexableMapping(OrderedDict):
     """Extend ``OrderedDict`` to allow index-based access to values."""
 
     def __getitem__(self, item):
         """Return an item either by index or name."""
-        try:
-            item + ''  # Raises if item not a string
+        if isinstance(item, str):
             return super().__getitem__(item)
-        except TypeError:
+
+        if isinstance(item, slice):
             return list(self.values())[item]
 
+        # Walk to a single position instead of building a list of all the values,
+        # from the end for negative indices
+        index = operator.index(item)
+        values = self.values()
+        if index < 0:
+            values, index = reversed(values), -index - 1
+        try:
+            return next(itertools.islice(values, index, None))
+        except StopIteration:
+            raise IndexError(f'{type(self).__name__} index out of range') from None
+
 
 class DatasetCollection(IndexableMapping):
     r"""Extend ``IndexableMapping`` to allow datetime-based filter queries.
@@ -49,14 +71,90 @@ class DatasetCollection(IndexableMapping):
     ``ds`` can be used to implement further filtering logic.
     """
 
-    default_regex = re.compile(r'(?P<year>\d{4})(?P<month>[01]\d)(?P<day>[0123]\d)_'
+    # The look-behind keeps the search from trying to start a date inside a run of digits
+    default_regex = re.compile(r'(?<!\d)(?P<year>\d{4})(?P<month>[01]\d)(?P<day>[0123]\d)_'
                                r'(?P<hour>[012]\d)(?P<minute>[0-5]\d)')
 
+    # Sorted time indices, keyed by (regex, strptime); reset whenever the collection changes
+    _time_indices = None
+
+    def _invalidate_times(self):
+        """Discard any cached time indices after the collection changes."""
+        self._time_indices = None
+
+    def __setitem__(self, key, value):
+        """Set an item, discarding any cached time indices."""
+        self._invalidate_times()
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        """Remove an item, discarding any cached time indices."""
+        self._invalidate_times()
+        super().__delitem__(key)
+
+    # OrderedDict's C implementations of these do not go through the methods above, so
+    # each needs to discard the cached time indices itself
+    def clear(self):
+        """Remove all items, discarding any cached time indices."""
+        self._invalidate_times()
+        super().clear()
+
+    def pop(self, key, *args):
+        """Remove and return an item, discarding any cached time indices."""
+        self._invalidate_times()
+        return super().pop(key, *args)
+
+    def popitem(self, last=True):
+        """Remove and return a (key, value) pair, discarding any cached time indices."""
+        self._invalidate_times()
+        return super().popitem(last=last)
+
+    def move_to_end(self, key, last=True):
+        """Move an existing key to either end, discarding any cached time indices."""
+        self._invalidate_times()
+        super().move_to_end(key, last=last)
+
+    def setdefault(self, key, default=None):
+        """Insert key with a value of default if key is not present."""
+        self._invalidate_times()
+        return super().setdefault(key, default)
+
+    def update(self, *args, **kwargs):
+        """Update from mappings or iterables, discarding any cached time indices."""
+        self._invalidate_times()
+        super().update(*args, **kwargs)
+
+    def _get_time_index(self, regex, strptime):
+        """Return the times found in the keys, and (time, position, value) sorted by time."""
+        if self._time_indices is None:
+            self._time_indices = {}
+
+        cache_key = (regex, strptime)
+        if cache_key not in self._time_indices:
+            index = sorted((dt, pos, value) for pos, (dt, value)
+                           in enumerate(self._get_datasets_with_times(regex, strptime)))
+            self._time_indices[cache_key] = ([item[0] for item in index], index)
+        return self._time_indices[cache_key]
+
     def _get_datasets_with_times(self, regex, strptime=None):
         # Set the default regex if we don't have one
         # If strptime is provided, pass the regex group named 'strptime' to strptime
         regex = self.default_regex if regex is None else re.compile(regex)
 
+        # Pick how to turn a match into a datetime once, rather than for every key
+        if strptime is not None:
+            def parse(match):
+                return datetime.strptime(match.groupdict().get('strptime', 0), strptime)
+        else:
+            # Find which of the date/time groups the regex provides up front, so that each
+            # match only needs to index the groups present
+            group_indices = [regex.groupindex.get(name) for name in
+                             ('year', 'month', 'day', 'hour', 'minute', 'second',
+                              'microsecond')]
+
+            def parse(match):
+                return datetime(*[int(match[i]) if i else 0 for i in group_indices])
+
         # Loop over the collection looking for keys that match our regex
         found_date = False
         for ds in self:
@@ -65,19 +163,7 @@ class DatasetCollection(IndexableMapping):
             # If we find one, make a datetime and yield it along with the value
             if match:
                 found_date = True
-                date_parts = match.groupdict()
-                if strptime is not None:
-                    date_str = date_parts.get('strptime', 0)
-                    dt = datetime.strptime(date_str, strptime)
-                else:
-                    dt = datetime(int(date_parts.get('year', 0)),
-                                  int(date_parts.get('month', 0)),
-                                  int(date_parts.get('day', 0)),
-                                  int(date_parts.get('hour', 0)),
-                                  int(date_parts.get('minute', 0)),
-                                  int(date_parts.get('second', 0)),
-                                  int(date_parts.get('microsecond', 0)))
-                yield dt, self[ds]
+                yield parse(match), self[ds]
 
         # If we never found any keys that match, we should let the user know that rather
         # than have it be the same as if nothing matched filters
@@ -117,8 +203,14 @@ class DatasetCollection(IndexableMapping):
             The value with a time closest to that desired
 
         """
-        return min(self._get_datasets_with_times(regex, strptime),
-                   key=lambda i: abs((i[0] - time).total_seconds()))[-1]
+        times, index = self._get_time_index(regex, strptime)
+
+        # Only the times on either side of the requested one can be closest; consider every
+        # item with those times, preferring the earliest in the collection on a tie
+        pos = bisect.bisect_left(times, time)
+        lo = bisect.bisect_left(times, times[max(pos - 1, 0)])
+        hi = bisect.bisect_right(times, times[min(pos, len(times) - 1)])
+        return min(index[lo:hi], key=lambda i: (abs((i[0] - time).total_seconds()), i[1]))[-1]
 
     def filter_time_range(self, start, end, regex=None, strptime=None):
         r"""Filter keys for all items within the desired time range.
@@ -157,8 +249,11 @@ class DatasetCollection(IndexableMapping):
         if start > end:
             warnings.warn('The provided start time comes after the end time. No data will '
                           'be returned.', UserWarning, stacklevel=2)
-        return [item[-1] for item in self._get_datasets_with_times(regex, strptime)
-                if start <= item[0] <= end]
+        times, index = self._get_time_index(regex, strptime)
+        in_range = index[bisect.bisect_left(times, start):bisect.bisect_right(times, end)]
+
+        # Return the items in the collection's order rather than sorted by time
+        return [item[-1] for item in sorted(in_range, key=lambda i: i[1])]
 
     def __str__(self):
         """Return a string representation of the collection."""
@@ -178,9 +273,12 @@ def _try_lower(arg):
 class CaseInsensitiveStr(str):
     """Extend ``str`` to use case-insensitive comparison and lookup."""
 
-    def __init__(self, *args):
+    def __new__(cls, *args, **kwargs):
         """Create str with a _lowered property."""
-        self._lowered = _try_lower(self)
+        # Lower the str that was created, which always works, rather than the argument
+        obj = super().__new__(cls, *args, **kwargs)
+        obj._lowered = str.lower(obj)
+        return obj
 
     def __hash__(self):
         """Hash str using _lowered property."""
@@ -211,6 +309,15 @@ class CaseInsensitiveStr(str):
         return str.__ne__(self._lowered, _try_lower(other))
 
 
+def _lookup_key(key):
+    """Return a key that finds the matching ``CaseInsensitiveStr`` key in a dict.
+
+    Stored keys hash as their lowered form and compare case-insensitively, so a plain
+    lowered ``str`` finds them without creating a ``CaseInsensitiveStr`` for every lookup.
+    """
+    return str.lower(key) if isinstance(key, str) else CaseInsensitiveStr(key)
+
+
 class CaseInsensitiveDict(dict):
     """Extend ``dict`` to use a case-insensitive key set."""
 
@@ -225,7 +332,7 @@ class CaseInsensitiveDict(dict):
 
     def __getitem__(self, key):
         """Return value from case-insensitive lookup of ``key``."""
-        return super().__getitem__(CaseInsensitiveStr(key))
+        return super().__getitem__(_lookup_key(key))
 
     def __setitem__(self, key, value):
         """Set value with lowercase ``key``."""
@@ -233,15 +340,15 @@ class CaseInsensitiveDict(dict):
 
     def __delitem__(self, key):
         """Delete value associated with case-insensitive lookup of ``key``."""
-        return super().__delitem__(CaseInsensitiveStr(key))
+        return super().__delitem__(_lookup_key(key))
 
     def __contains__(self, key):
         """Return true if key set includes case-insensitive ``key``."""
-        return super().__contains__(CaseInsensitiveStr(key))
+        return super().__contains__(_lookup_key(key))
 
     def pop(self, key, *args, **kwargs):
         """Remove and return the value associated with case-insensitive ``key``."""
-        return super().pop(CaseInsensitiveStr(key))
+        return super().pop(_lookup_key(key))
 
     def _keys_to_lower(self):
         """Convert key set to lowercase."""
@@ -251,6 +358,23 @@ class CaseInsensitiveDict(dict):
             self.__setitem__(CaseInsensitiveStr(k), val)
 
 
+@functools.lru_cache(maxsize=16)
+def _lowered_names(names):
+    """Return a frozenset of the lowercase forms of a tuple of names."""
+    return frozenset(name.lower() for name in names)
+
+
+def _make_service_dict(services):
+    """Map service names to services, including those within compound services."""
+    service_dict = CaseInsensitiveDict({})
+    for service in services:
+        service_dict[service.name] = service
+        if isinstance(service, CompoundService):
+            for subservice in service.services:
+                service_dict[subservice.name] = subservice
+    return service_dict
+
+
 class TDSCatalog:
     """
     Parse information from a THREDDS Client Catalog.
@@ -272,7 +396,7 @@ class TDSCatalog:
 
     """
 
-    def __init__(self, catalog_url):
+    def __init__(self, catalog_url, session=None):
         """
         Initialize the TDSCatalog object.
 
@@ -280,9 +404,14 @@ class TDSCatalog:
         ----------
         catalog_url : str
             The URL of a THREDDS client catalog
+        session : requests.Session, optional
+            An existing session to use for requests. This allows connections to be reused
+            across catalogs on the same server. If not given, a new session is created
+            (and closed when the catalog is deleted).
 
         """
-        self.session = session_manager.create_session()
+        self._owns_session = session is None
+        self.session = session_manager.create_session() if session is None else session
 
         # get catalog.xml file
         resp = self.session.get(catalog_url)
@@ -293,9 +422,9 @@ class TDSCatalog:
         self.base_tds_url = _find_base_tds_url(self.catalog_url)
 
         # If we were given an HTML link, warn about it and try to fix to xml
-        if 'html' in resp.headers['content-type']:
+        if 'html' in resp.headers.get('content-type', ''):
             import warnings
-            new_url = self.catalog_url.replace('html', 'xml')
+            new_url = re.sub(r'\.html(?=\?|#|$)', '.xml', self.catalog_url, count=1)
             warnings.warn(f'URL {self.catalog_url} returned HTML. Changing to: {new_url}',
                           stacklevel=2)
             self.catalog_url = new_url
@@ -316,7 +445,7 @@ class TDSCatalog:
         current_dataset = None
         previous_dataset = None
         for child in root.iter():
-            tag_type = child.tag.split('}')[-1]
+            tag_type = child.tag.rpartition('}')[2]
             if tag_type == 'dataset':
                 current_dataset = child.attrib['name']
                 self._process_dataset(child)
@@ -336,8 +465,7 @@ class TDSCatalog:
             elif (tag_type == 'metadata') or (tag_type == ''):
                 self._process_metadata(child, tag_type)
             elif tag_type == 'service':
-                if (CaseInsensitiveStr(child.attrib['serviceType'])
-                        != CaseInsensitiveStr('Compound')):
+                if child.attrib['serviceType'].lower() != _COMPOUND_SERVICE:
                     # we do not want to process single services if they
                     # are already contained within a compound service, so
                     # we need to skip over those cases.
@@ -364,8 +492,9 @@ class TDSCatalog:
         return str(self.catalog_name)
 
     def __del__(self):
-        """When TDSCatalog is deleted, close any open sessions."""
-        self.session.close()
+        """When TDSCatalog is deleted, close any sessions it opened."""
+        if getattr(self, '_owns_session', False):
+            self.session.close()
 
     def _process_dataset(self, element):
         catalog_url = ''
@@ -385,17 +514,18 @@ class TDSCatalog:
         self.metadata = TDSCatalogMetadata(element, self.metadata).metadata
 
     def _process_datasets(self):
+        # Look up services by name once for all of the datasets
+        service_dict = _make_service_dict(self.services)
+        with_access_elements = set(self.ds_with_access_elements_to_process)
+
         # Need to use list (of keys) because we modify the dict while iterating
         for ds_name in list(self.datasets):
             # check to see if dataset needs to have access urls created, if not,
             # remove the dataset
             has_url_path = self.datasets[ds_name].url_path is not None
-            is_ds_with_access_elements_to_process = (
-                ds_name in self.ds_with_access_elements_to_process
-            )
-            if has_url_path or is_ds_with_access_elements_to_process:
+            if has_url_path or ds_name in with_access_elements:
                 self.datasets[ds_name].make_access_urls(
-                    self.base_tds_url, self.services, metadata=self.metadata)
+                    self.base_tds_url, service_dict, metadata=self.metadata)
             else:
                 self.datasets.pop(ds_name)
 
@@ -405,7 +535,7 @@ class TDSCatalog:
         for service in self.services:
             if service.is_resolver():
                 latest_cat = self.catalog_url.replace('catalog.xml', 'latest.xml')
-                return TDSCatalog(latest_cat).datasets[0]
+                return TDSCatalog(latest_cat, session=self.session).datasets[0]
         raise AttributeError('"latest" not available for this catalog')
 
     __repr__ = __str__
@@ -480,8 +610,7 @@ class Dataset:
 
     """
 
-    ncss_service_names = (CaseInsensitiveStr('NetcdfSubset'),
-                          CaseInsensitiveStr('NetcdfServer'))
+    ncss_service_names = ('NetcdfSubset', 'NetcdfServer')
 
     def __init__(self, element_node, catalog_url=''):
         """Initialize the Dataset object.
@@ -525,7 +654,7 @@ class Dataset:
 
         """
         if catalog_url != '':
-            resolver_base = catalog_url.split('catalog.xml')[0]
+            resolver_base = catalog_url.partition('catalog.xml')[0]
             resolver_url = resolver_base + self.url_path
             resolver_xml = session_manager.urlopen(resolver_url)
             tree = ET.parse(resolver_xml)
@@ -535,7 +664,7 @@ class Dataset:
             found = False
             for child in root.iter():
                 if not found:
-                    tag_type = child.tag.split('}')[-1]
+                    tag_type = child.tag.rpartition('}')[2]
                     if tag_type == 'dataset' and 'urlPath' in child.attrib:
                         ds = Dataset(child)
                         resolved_url = ds.url_path
@@ -553,18 +682,17 @@ class Dataset:
         ----------
         catalog_url : str
             The top level server url
-        all_services : List[SimpleService]
-            list of :class:`SimpleService` objects associated with the dataset
+        all_services : List[SimpleService] or CaseInsensitiveDict
+            list of :class:`SimpleService` objects associated with the dataset, or a
+            mapping of these (including those within any :class:`CompoundService`) by name
         metadata : dict
             Metadata from the :class:`TDSCatalog`
 
         """
-        all_service_dict = CaseInsensitiveDict({})
-        for service in all_services:
-            all_service_dict[service.name] = service
-            if isinstance(service, CompoundService):
-                for subservice in service.services:
-                    all_service_dict[subservice.name] = subservice
+        if isinstance(all_services, CaseInsensitiveDict):
+            all_service_dict = all_services
+        else:
+            all_service_dict = _make_service_dict(all_services)
 
         service_name = metadata.get('serviceName', None)
 
@@ -614,8 +742,17 @@ class Dataset:
         """
         if filename is None:
             filename = self.name
-        with self.remote_open() as infile, open(filename, 'wb') as outfile:
-            outfile.write(infile.read())
+
+        # Stream the data to the file in chunks rather than holding it all in memory, and
+        # don't leave a partial file behind if the transfer fails
+        remote = self.access_with_service('HTTPServer', stream=True)
+        with contextlib.closing(remote) as infile, open(filename, 'wb') as outfile:
+            try:
+                shutil.copyfileobj(infile, outfile, 1 << 20)
+            except BaseException:
+                outfile.close()
+                os.remove(filename)
+                raise
 
     def remote_open(self, mode='b', encoding='ascii', errors='ignore'):
         """Open the remote dataset for random access.
@@ -670,8 +807,7 @@ class Dataset:
         if service is None:
             service = 'CdmRemote' if 'CdmRemote' in self.access_urls else 'OPENDAP'
 
-        if service not in (CaseInsensitiveStr('CdmRemote'), CaseInsensitiveStr('OPENDAP'),
-                           CaseInsensitiveStr('DODS')):
+        if service.lower() not in _REMOTE_SERVICES:
             raise ValueError(service + ' is not a valid service for remote_access')
 
         return self.access_with_service(service, use_xarray)
@@ -700,13 +836,17 @@ class Dataset:
                     break
             else:
                 raise RuntimeError('Subset access is not available for this dataset.')
-        elif service not in self.ncss_service_names:
+        elif not self._is_ncss_service(service):
             raise ValueError(service + ' is not a valid service for subset. Options are: '
                              + ', '.join(self.ncss_service_names))
 
         return self.access_with_service(service)
 
-    def access_with_service(self, service, use_xarray=None):
+    def _is_ncss_service(self, service):
+        """Return whether ``service`` is one of ``ncss_service_names``, ignoring case."""
+        return service.lower() in _lowered_names(self.ncss_service_names)
+
+    def access_with_service(self, service, use_xarray=None, **kwargs):
         """Access the dataset using a particular service.
 
         Return an Python object capable of communicating with the server using the particular
@@ -717,6 +857,9 @@ class Dataset:
         ----------
         service : str
             The name of the service for accessing the dataset
+        kwargs
+            Additional keyword arguments to pass when creating the object for ``service``,
+            such as ``stream=True`` for 'HTTPServer'.
 
         Returns
         -------
@@ -751,7 +894,7 @@ class Dataset:
                 except ImportError:
                     raise ImportError('OPENDAP access needs netCDF4-python'
                                       'to be installed.') from None
-        elif service in self.ncss_service_names:
+        elif self._is_ncss_service(service):
             from .ncss import NCSS
             provider = NCSS
         elif service == 'HTTPServer' or service == CaseInsensitiveStr('http'):
@@ -760,10 +903,12 @@ class Dataset:
             raise ValueError(service + ' is not an access method supported by Siphon')
 
         try:
-            return provider(self.access_urls[service])
+            url = self.access_urls[service]
         except KeyError:
             raise ValueError(service + ' is not available for this dataset') from None
 
+        return provider(url, **kwargs)
+
     __repr__ = __str__
 
 
@@ -847,6 +992,7 @@ class CompoundService:
         return False
 
 
+@functools.lru_cache(maxsize=64)
 def _find_base_tds_url(catalog_url):
     """Identify the base URL of the THREDDS server from the catalog URL.
 
@@ -3,16 +3,19 @@
 # SPDX-License-Identifier: BSD-3-Clause
 """Utility code to support making requests using HTTP."""
 
-from collections import OrderedDict
 from datetime import datetime, timedelta, tzinfo
+import functools
 import gzip
 from io import BytesIO
 from itertools import chain
 import posixpath
+import re
+import threading
 from urllib.parse import urlencode, urljoin  # noqa: F401
 import warnings
 
 import requests
+from requests.adapters import HTTPAdapter, Retry
 
 from . import __version__
 
@@ -52,6 +55,7 @@ class HTTPSessionManager:
         """Initialize ``HTTPSessionManager``."""
         self.user_agent = f'Siphon ({__version__})'
         self.options = {}
+        self._local = threading.local()
 
     def set_session_options(self, **kwargs):
         """Set options for created session instances.
@@ -69,6 +73,10 @@ class HTTPSessionManager:
     def create_session(self):
         """Create a new HTTP session with our user-agent set.
 
+        The session keeps a pool of connections to each host, so that repeated requests
+        to a server reuse connections, and retries idempotent requests that fail to
+        connect or return a gateway error.
+
         Returns
         -------
         session : requests.Session
@@ -80,22 +88,57 @@ class HTTPSessionManager:
 
         """
         ret = requests.Session()
+        retries = Retry(total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504),
+                        raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=32, max_retries=retries)
+        ret.mount('http://', adapter)
+        ret.mount('https://', adapter)
         ret.headers['User-Agent'] = self.user_agent
         for k, v in self.options.items():
             setattr(ret, k, v)
         return ret
 
-    def urlopen(self, url, decompress=False, **kwargs):
+    def _get_session(self):
+        """Return the session shared by calls to `urlopen` in the current thread.
+
+        Each thread gets its own session, since :class:`requests.Session` is not
+        thread-safe. The session is created on first use and replaced (closing the old
+        one) whenever the user agent or session options change, so that connections
+        are reused between calls.
+        """
+        local = self._local
+        settings = (self.user_agent, dict(self.options))
+        session = getattr(local, 'session', None)
+        if session is None or settings != local.settings:
+            if session is not None:
+                session.close()
+            session = local.session = self.create_session()
+            local.settings = settings
+        return session
+
+    def urlopen(self, url, decompress=False, stream=False, **kwargs):
         """GET a file-like object for a URL using HTTP.
 
         This is a thin wrapper around :meth:`requests.Session.get` that returns a file-like
         object wrapped around the resulting content.
 
+        Calls made from the same thread share a session, so connections to a server are
+        reused. Any state the session keeps, such as cookies set by a server, is therefore
+        also shared with later calls in that thread.
+
         Parameters
         ----------
         url : str
             The URL to request
 
+        decompress : bool, optional
+            Whether to gunzip the content. Defaults to False.
+
+        stream : bool, optional
+            If True, return a file-like object that reads the content from the network as
+            it is consumed, rather than downloading all of it up front. This object should
+            be closed once it is no longer needed. Defaults to False.
+
         kwargs
             Additional keyword arguments to pass to :meth:`requests.Session.get`.
 
@@ -109,7 +152,13 @@ class HTTPSessionManager:
         :meth:`requests.Session.get`
 
         """
-        fobj = BytesIO(self.create_session().get(url, **kwargs).content)
+        resp = self._get_session().get(url, stream=stream, **kwargs)
+        if stream:
+            # Have reads undo any content-encoding, as accessing content would
+            fobj = resp.raw
+            fobj.decode_content = True
+        else:
+            fobj = BytesIO(resp.content)
         if decompress:
             fobj = gzip.GzipFile(fileobj=fobj)
         return fobj
@@ -118,9 +167,18 @@ class HTTPSessionManager:
 session_manager = HTTPSessionManager()
 
 
+# Only ASCII digits, so that this matches exactly what strptime would accept
+_iso_date_regex = re.compile(r'([0-9]{4})-([0-9]{2})-([0-9]{2})'
+                             r'T([0-9]{2}):([0-9]{2}):([0-9]{2})Z')
+
+
+@functools.lru_cache(maxsize=4096)
 def parse_iso_date(s):
     """Parse a string containing an ISO-8601 formatted date.
 
+    Results are cached, since the same timestamp typically appears many times in
+    a single response.
+
     Parameters
     ----------
     s : str
@@ -132,6 +190,14 @@ def parse_iso_date(s):
         The results of parsing the string
 
     """
+    # Fast path for the canonical, zero-padded form (e.g. 2015-06-15T12:00:00Z), which
+    # avoids the overhead of strptime's format handling
+    match = _iso_date_regex.fullmatch(s)
+    if match:
+        try:
+            return datetime(*map(int, match.groups()), tzinfo=utc)
+        except ValueError:
+            pass
     return datetime.strptime(s, '%Y-%m-%dT%H:%M:%SZ').replace(tzinfo=utc)
 
 
@@ -146,12 +212,14 @@ class DataQuery:
     properly escaped string for a URL.
     """
 
+    __slots__ = ('var', 'time_query', 'spatial_query', 'extra_params')
+
     def __init__(self):
         """Construct an empty class representing a query for data."""
         self.var = set()
-        self.time_query = OrderedDict()
-        self.spatial_query = OrderedDict()
-        self.extra_params = OrderedDict()
+        self.time_query = {}
+        self.spatial_query = {}
+        self.extra_params = {}
 
     def variables(self, *var_names):
         """Specify one or more variables for the query.
@@ -172,7 +240,7 @@ class DataQuery:
             Returns self for chaining calls
 
         """
-        self.var.update(set(var_names))
+        self.var.update(var_names)
         return self
 
     def add_query_parameter(self, **kwargs):
@@ -369,17 +437,23 @@ class HTTPEndPoint:
     validate them, parse metadata as appropriate, and parse returns from requests.
     """
 
-    def __init__(self, url):
+    def __init__(self, url, session=None):
         """Create an HTTPEndPoint instance.
 
         Parameters
         ----------
         url : str
             The base URL for the endpoint
+        session : requests.Session, optional
+            An existing session to use for requests, allowing connections to be shared
+            between endpoints. If not given, a new session is created.
 
         """
         self._base = url
-        self._session = session_manager.create_session()
+        # Pre-compute the forms of the base URL used to build request URLs
+        self._query_url = url[:-1] if url[-1] == '/' else url
+        self._path_prefix = posixpath.join(url, '')
+        self._session = session_manager.create_session() if session is None else session
         self._get_metadata()
 
     def get_query(self, query):
@@ -402,8 +476,7 @@ class HTTPEndPoint:
         get_path, get
 
         """
-        url = self._base[:-1] if self._base[-1] == '/' else self._base
-        return self.get(url, query)
+        return self.get(self._query_url, query)
 
     def url_path(self, path):
         """Assemble the full url to a path.
@@ -425,7 +498,7 @@ class HTTPEndPoint:
         get_path
 
         """
-        return posixpath.join(self._base, path)
+        return path if path.startswith('/') else self._path_prefix + path
 
     def get_path(self, path, query=None):
         """Make a GET request, optionally including a query, to a relative path.
@@ -166,7 +166,7 @@ class _SimpleTypes:
 class _ComplexTypes:
     @staticmethod
     def _get_tag_name(element):
-        element_name = element.tag.split('}')[-1] if '}' in element.tag else element.tag
+        element_name = element.tag.rpartition('}')[2]
         return element_name
 
     @staticmethod
@@ -485,7 +485,7 @@ class TDSCatalogMetadata:
 
     @staticmethod
     def _get_tag_name(element):
-        element_name = element.tag.split('}')[-1] if '}' in element.tag else element.tag
+        element_name = element.tag.rpartition('}')[2]
         return element_name
 
     @staticmethod
@@ -145,6 +145,8 @@ class NCSSQuery(DataQuery):
     specific to NCSS.
     """
 
+    __slots__ = ()
+
     def projection_box(self, min_x, min_y, max_x, max_y):
         """Add a bounding box in projected (native) coordinates to the query.
 
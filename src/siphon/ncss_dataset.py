@@ -5,7 +5,6 @@
 
 
 import logging
-import re
 
 import numpy as np
 
@@ -20,7 +19,17 @@ def _without_namespace(tagname):
     return tagname
 
 
+def _split_values(val):
+    """Split a string of values separated by spaces and/or commas."""
+    return filter(None, val.replace(',', ' ').split(' '))
+
+
 class _Types:
+    def __init__(self):
+        # Map element names to their handlers once, rather than searching per element
+        self._handlers = {name[len('handle_'):]: getattr(self, name) for name in dir(self)
+                          if name.startswith('handle_')}
+
     @staticmethod
     def handle_typed_values(val, type_name, value_type):
         """Translate typed values into the appropriate python object.
@@ -73,17 +82,17 @@ class _Types:
             A list containing the properly typed python values.
 
         """
-        if value_type in ['byte', 'short', 'int', 'long']:
+        if value_type in {'byte', 'short', 'int', 'long'}:
             try:
                 if val := val.strip('[]'):
-                    val = [int(v) for v in re.split('[ ,]', val) if v]
+                    val = list(map(int, _split_values(val)))
                 else:
                     return [0]
             except ValueError:
                 log.warning('Cannot convert "%s" to int. Keeping type as str.', val)
-        elif value_type in ['float', 'double']:
+        elif value_type in {'float', 'double'}:
             try:
-                val = [float(v) for v in re.split('[ ,]', val) if v]
+                val = list(map(float, _split_values(val)))
             except ValueError:
                 log.warning('Cannot convert "%s" to float. Keeping type as str.', val)
         elif value_type == 'boolean':
@@ -92,7 +101,7 @@ class _Types:
                 val = val.split()
                 # values must be either true or false
                 for potential_bool in val:
-                    if potential_bool not in ['true', 'false']:
+                    if potential_bool not in {'true', 'false'}:
                         raise ValueError
                 val = [item == 'true' for item in val]
             except ValueError:
@@ -117,13 +126,10 @@ class _Types:
 
     def handle_attribute(self, element):  # noqa
         type_name = 'attribute'
-        attribute_type = None
-        if 'type' in element.attrib:
-            attribute_type = element.attrib['type']
-
-        name = element.attrib['name']
-        val = element.attrib['value']
-        if attribute_type:
+        attrib = element.attrib
+        name = attrib['name']
+        val = attrib['value']
+        if attribute_type := attrib.get('type'):
             val = self.handle_typed_values(val, type_name, attribute_type)
 
         return {name: val}
@@ -199,11 +205,11 @@ class _Types:
         return self.handle_grid(element)
 
     def lookup(self, handler_name):
-        handler_name = 'handle_' + _without_namespace(handler_name)
-        if handler_name in dir(self):
-            return getattr(self, handler_name)
-        else:
-            log.warning('cannot find handler for element %s', handler_name)
+        handler_name = _without_namespace(handler_name)
+        try:
+            return self._handlers[handler_name]
+        except KeyError:
+            log.warning('cannot find handler for element handle_%s', handler_name)
         return None
 
 
@@ -20,6 +20,8 @@ class RadarQuery(DataQuery):
     specific to the radar data query service.
     """
 
+    __slots__ = ()
+
     def stations(self, *stns):
         """Specify one or more stations for the query.
 
@@ -63,22 +65,25 @@ class RadarServer(HTTPEndPoint):
 
     """
 
-    def __init__(self, url):
+    def __init__(self, url, session=None):
         """Create a RadarServer instance.
 
         Parameters
         ----------
         url : str
             The base URL for the endpoint
+        session : requests.Session, optional
+            An existing session to use for requests, including those for catalogs. If
+            not given, a new session is created.
 
         """
         xmlfile = '/dataset.xml'
         if url.endswith(xmlfile):
             url = url[:-len(xmlfile)]
-        super().__init__(url)
+        super().__init__(url, session=session)
 
     def _get_metadata(self):
-        ds_cat = TDSCatalog(self.url_path('dataset.xml'))
+        ds_cat = TDSCatalog(self.url_path('dataset.xml'), session=self._session)
         self.metadata = ds_cat.metadata
         self.variables = {k.split('/')[0] for k in self.metadata['variables']}
         self._get_stations()
@@ -118,11 +123,10 @@ class RadarServer(HTTPEndPoint):
         valid = True
         # Make sure all stations are in the table
         if 'stn' in query.spatial_query:
-            valid = valid and all(stid in self.stations
-                                  for stid in query.spatial_query['stn'])
+            valid = self.stations.keys() >= set(query.spatial_query['stn'])
 
         if query.var:
-            valid = valid and all(var in self.variables for var in query.var)
+            valid = valid and query.var <= self.variables
 
         return valid
 
@@ -154,9 +158,7 @@ class RadarServer(HTTPEndPoint):
         """
         # TODO: Refactor TDSCatalog so we don't need two requests, or to do URL munging
         try:
-            url = self._base[:-1] if self._base[-1] == '/' else self._base
-            url += '?' + str(query)
-            return TDSCatalog(url)
+            return TDSCatalog(self._query_url + '?' + str(query), session=self._session)
         except ET.ParseError as e:
             raise BadQueryError(self.get_catalog_raw(query)) from e
 
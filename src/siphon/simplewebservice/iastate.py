@@ -3,8 +3,6 @@
 # SPDX-License-Identifier: BSD-3-Clause
 """Read upper air data from the IA State archives."""
 
-from datetime import datetime
-import json
 import warnings
 
 import numpy as np
@@ -98,15 +96,20 @@ class IAStateUpperAir(HTTPEndPoint):
 
         """
         json_data = self._get_data_raw(time, site_id, pressure)
-        data = {}
-        for profile in json_data['profiles']:
-            for pt in profile['profile']:
-                for field in ('drct', 'dwpc', 'hght', 'pres', 'sknt', 'tmpc'):
-                    data.setdefault(field, []).append(np.nan if pt[field] is None
-                                                      else pt[field])
-                for field in ('station', 'valid'):
-                    data.setdefault(field, []).append(np.nan if profile[field] is None
-                                                      else profile[field])
+        profiles = json_data['profiles']
+
+        # Flatten the points of all the profiles and build a column at a time; converting
+        # to float turns missing (None) values into NaN
+        points = [pt for profile in profiles for pt in profile['profile']]
+        data = {field: np.array([pt[field] for pt in points], dtype=np.float64)
+                for field in ('drct', 'dwpc', 'hght', 'pres', 'sknt', 'tmpc')}
+
+        # Repeat each profile's station and time for all of its points
+        counts = [len(profile['profile']) for profile in profiles]
+        for field in ('station', 'valid'):
+            values = np.array([np.nan if profile[field] is None else profile[field]
+                               for profile in profiles], dtype=object)
+            data[field] = np.repeat(values, counts)
 
         # Make sure that the first entry has a valid temperature and dewpoint
         idx = np.argmax(~(np.isnan(data['tmpc']) | np.isnan(data['dwpc'])))
@@ -120,8 +123,7 @@ class IAStateUpperAir(HTTPEndPoint):
         df['direction'] = ma.masked_invalid(data['drct'][idx:])
         df['speed'] = ma.masked_invalid(data['sknt'][idx:])
         df['station'] = data['station'][idx:]
-        df['time'] = [datetime.strptime(valid, '%Y-%m-%dT%H:%M:%SZ')
-                      for valid in data['valid'][idx:]]
+        df['time'] = pd.to_datetime(data['valid'][idx:], format='%Y-%m-%dT%H:%M:%SZ')
 
         # Calculate the u and v winds
         df['u_wind'], df['v_wind'] = get_wind_components(df['speed'],
@@ -172,7 +174,7 @@ class IAStateUpperAir(HTTPEndPoint):
             query['pressure'] = pressure
 
         resp = self.get_path('raob.py', query)
-        json_data = json.loads(resp.text)
+        json_data = resp.json()
 
         # See if the return is valid, but has no data
         if not (json_data['profiles'] and json_data['profiles'][0]['profile']):
@@ -4,7 +4,7 @@
 """Read upper air data from the Integrated Global Radiosonde Archive version 2."""
 
 import datetime
-from io import BytesIO, StringIO
+from io import BytesIO, StringIO, TextIOWrapper
 import itertools
 import sys
 import warnings
@@ -85,8 +85,8 @@ class IGRAUpperAir(HTTPEndPoint):
 
         params = self._get_fwf_params()
 
-        df_body = pd.read_fwf(StringIO(body), **params['body'])
-        df_header = pd.read_fwf(StringIO(header), **params['header'])
+        df_body = self._read_fwf(body, **params['body'])
+        df_header = self._read_fwf(header, **params['header'])
         df_body['date'] = dates_long
 
         df_body = self._clean_body_df(df_body)
@@ -110,10 +110,11 @@ class IGRAUpperAir(HTTPEndPoint):
             raise ValueError(f'No data available for {self.begin_date:%Y-%m-%d %HZ} '
                              f'for station {self.site_id}.') from e
 
-        file_info = ZipFile(BytesIO(resp.content)).infolist()[0]
         with ZipFile(BytesIO(resp.content)) as zf:
-            f = zf.open(file_info)
-            lines = [line.decode('utf-8') for line in f.readlines()]
+            # Decode while splitting, only on newlines, rather than line by line
+            with TextIOWrapper(zf.open(zf.infolist()[0]), encoding='utf-8',
+                               newline='\n') as f:
+                lines = f.readlines()
             body, header, dates_long, dates = self._select_date_range(lines)
             return body, header, dates_long, dates
 
@@ -175,20 +176,26 @@ class IGRAUpperAir(HTTPEndPoint):
 
         return body, header, dates_long, dates
 
+    @staticmethod
+    def _read_fwf(text, decimals, **kwargs):
+        """Read fixed-width text into a dataframe.
+
+        Columns in `decimals` hold values stored as integers in units of 10^-power; these
+        are parsed as numbers and scaled in one vectorized pass rather than converting
+        each value in Python.
+        """
+        df = pd.read_fwf(StringIO(text), **kwargs)
+        for col, power in decimals.items():
+            vals = df[col].astype('float64')
+            df[col] = vals.mask(vals.isin((-9999, -8888, -99999))) / 10**power
+        return df
+
     def _get_fwf_params(self):
         """Produce a dictionary with names, colspecs, and dtype for IGRA2 data.
 
-        Returns a dict with entries 'body' and 'header'.
+        Returns a dict with entries 'body' and 'header'. Each of these includes
+        ``decimals``, mapping columns stored as 'value*10^power' to the power to scale by.
         """
-        def _cdec(power=1):
-            """Make a function to convert string 'value*10^power' to float."""
-            def _cdec_power(val):
-                if val in ['-9999', '-8888', '-99999']:
-                    return np.nan
-                else:
-                    return float(val) / 10**power
-            return _cdec_power
-
         def _cflag(val):
             """Replace alphabetic flags A and B with numeric."""
             if val == 'A':
@@ -241,26 +248,27 @@ class IGRAUpperAir(HTTPEndPoint):
                              (80, 87), (88, 95), (96, 103), (104, 111), (112, 119),
                              (120, 127), (128, 135), (137, 143), (144, 151)]
 
-            conv_body = {'pressure': _cdec(power=2),
-                         'reported_height': int,
+            conv_body = {'reported_height': int,
                          'calculated_height': int,
-                         'temperature': _cdec(),
-                         'temperature_gradient': _cdec(),
-                         'potential_temperature': _cdec(),
-                         'potential_temperature_gradient': _cdec(),
-                         'virtual_temperature': _cdec(),
-                         'virtual_potential_temperature': _cdec(),
-                         'vapor_pressure': _cdec(power=3),
-                         'saturation_vapor_pressure': _cdec(power=3),
-                         'reported_relative_humidity': _cdec(),
-                         'calculated_relative_humidity': _cdec(),
-                         'relative_humidity_gradient': _cdec(),
-                         'u_wind': _cdec(),
-                         'u_wind_gradient': _cdec(),
-                         'v_wind': _cdec(),
-                         'v_wind_gradient': _cdec(),
                          'refractive_index': int}
 
+            dec_body = {'pressure': 2,
+                        'temperature': 1,
+                        'temperature_gradient': 1,
+                        'potential_temperature': 1,
+                        'potential_temperature_gradient': 1,
+                        'virtual_temperature': 1,
+                        'virtual_potential_temperature': 1,
+                        'vapor_pressure': 3,
+                        'saturation_vapor_pressure': 3,
+                        'reported_relative_humidity': 1,
+                        'calculated_relative_humidity': 1,
+                        'relative_humidity_gradient': 1,
+                        'u_wind': 1,
+                        'u_wind_gradient': 1,
+                        'v_wind': 1,
+                        'v_wind_gradient': 1}
+
             names_header = ['site_id', 'year', 'month', 'day', 'hour', 'release_time',
                             'number_levels', 'precipitable_water', 'inv_pressure',
                             'inv_height', 'inv_strength', 'mixed_layer_pressure',
@@ -284,19 +292,11 @@ class IGRAUpperAir(HTTPEndPoint):
                            'hour': int,
                            'release_time': _ctime(strformat='HHMM'),
                            'number_levels': int,
-                           'precipitable_water': _cdec(power=2),
-                           'inv_pressure': _cdec(power=2),
                            'inv_height': int,
-                           'inv_strength': _cdec(),
-                           'mixed_layer_pressure': _cdec(power=2),
                            'mixed_layer_height': int,
-                           'freezing_point_pressure': _cdec(power=2),
                            'freezing_point_height': int,
-                           'lcl_pressure': _cdec(power=2),
                            'lcl_height': int,
-                           'lfc_pressure': _cdec(power=2),
                            'lfc_height': int,
-                           'lnb_pressure': _cdec(power=2),
                            'lnb_height': int,
                            'lifted_index': int,
                            'showalter_index': int,
@@ -305,6 +305,15 @@ class IGRAUpperAir(HTTPEndPoint):
                            'cape': int,
                            'convective_inhibition': int}
 
+            dec_header = {'precipitable_water': 2,
+                          'inv_pressure': 2,
+                          'inv_strength': 1,
+                          'mixed_layer_pressure': 2,
+                          'freezing_point_pressure': 2,
+                          'lcl_pressure': 2,
+                          'lfc_pressure': 2,
+                          'lnb_pressure': 2}
+
             na_vals = ['-99999']
 
         else:
@@ -320,16 +329,17 @@ class IGRAUpperAir(HTTPEndPoint):
             conv_body = {'lvltyp1': int,
                          'lvltyp2': int,
                          'etime': _ctime(strformat='MMMSS'),
-                         'pressure': _cdec(power=2),
                          'pflag': _cflag,
                          'height': int,
                          'zflag': _cflag,
-                         'temperature': _cdec(),
                          'tflag': _cflag,
-                         'relative_humidity': _cdec(),
-                         'dewpoint_depression': _cdec(),
-                         'direction': int,
-                         'speed': _cdec()}
+                         'direction': int}
+
+            dec_body = {'pressure': 2,
+                        'temperature': 1,
+                        'relative_humidity': 1,
+                        'dewpoint_depression': 1,
+                        'speed': 1}
 
             names_header = ['site_id', 'year', 'month', 'day', 'hour', 'release_time',
                             'number_levels', 'pressure_source_code',
@@ -346,14 +356,18 @@ class IGRAUpperAir(HTTPEndPoint):
                            'latitude': _clatlon,
                            'longitude': _clatlon}
 
+            dec_header = {}
+
         return {'body': {'names': names_body,
                          'colspecs': colspecs_body,
                          'converters': conv_body,
+                         'decimals': dec_body,
                          'na_values': na_vals,
                          'index_col': False},
                 'header': {'names': names_header,
                            'colspecs': colspecs_header,
                            'converters': conv_header,
+                           'decimals': dec_header,
                            'na_values': na_vals,
                            'index_col': False}}
 
@@ -3,12 +3,77 @@
 # SPDX-License-Identifier: BSD-3-Clause
 """Utilities for testing siphon."""
 
+import contextlib
+import functools
 import os.path
+import pickle
 
 import vcr
+from vcr.persisters.filesystem import FilesystemPersister
+
+
+class PickleCachePersister(FilesystemPersister):
+    """Persist cassettes as usual, but cache the parsed contents using pickle.
+
+    Parsing the YAML for a cassette is much slower than loading a pickle, so the parsed
+    cassette is saved alongside the original file and reused while the cassette's
+    modification time and size, and the version of vcrpy, are unchanged.
+    """
+
+    @staticmethod
+    def _cache_path(cassette_path):
+        return os.fspath(cassette_path) + '.pkl'
+
+    @classmethod
+    def load_cassette(cls, cassette_path, serializer):
+        """Load a cassette, using the cached parse if it is up to date."""
+        try:
+            stat = os.stat(cassette_path)
+        except OSError:
+            return super().load_cassette(cassette_path, serializer)
+
+        # The cache holds vcrpy objects, so it is only valid for the same vcrpy version
+        key = (vcr.__version__, stat.st_mtime_ns, stat.st_size)
+        cache_path = cls._cache_path(cassette_path)
+        # A missing, unreadable, or incompatible cache just means parsing the cassette again
+        with contextlib.suppress(Exception):
+            with open(cache_path, 'rb') as cache:
+                cached_key, cassette = pickle.load(cache)  # noqa: S301
+            if cached_key == key:
+                return cassette
+
+        cassette = super().load_cassette(cassette_path, serializer)
+
+        # Failing to write the cache is harmless, since the cassette has already been parsed;
+        # the temporary name still matches the ignored *.pkl pattern in case cleanup fails
+        tmp_path = f'{cache_path}.{os.getpid()}.tmp.pkl'
+        try:
+            with open(tmp_path, 'wb') as cache:
+                pickle.dump((key, cassette), cache, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except Exception:
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)
+        return cassette
+
+    @classmethod
+    def save_cassette(cls, cassette_path, cassette_dict, serializer):
+        """Save a cassette, removing any stale cached parse."""
+        super().save_cassette(cassette_path, cassette_dict, serializer)
+        with contextlib.suppress(OSError):
+            os.remove(cls._cache_path(cassette_path))
+
+
+@functools.cache
+def _recorder_for(cassette_dir):
+    recorder = vcr.VCR(cassette_library_dir=cassette_dir)
+    recorder.register_persister(PickleCachePersister)
+    return recorder
 
 
 def get_recorder(test_file_path):
-    """Return an appropriate response recorder for the given path."""
-    return vcr.VCR(cassette_library_dir=os.path.join(os.path.dirname(test_file_path),
-                                                     'fixtures'))
+    """Return an appropriate response recorder for the given path.
+
+    Test files sharing a fixtures directory share a single recorder.
+    """
+    return _recorder_for(os.path.join(os.path.dirname(test_file_path), 'fixtures'))
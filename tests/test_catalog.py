@@ -8,7 +8,8 @@ import logging
 
 import pytest
 
-from siphon.catalog import get_latest_access_url, TDSCatalog
+from siphon.catalog import DatasetCollection, get_latest_access_url, TDSCatalog
+from siphon.http_util import session_manager
 from siphon.testing import get_recorder
 
 log = logging.getLogger('siphon.catalog')
@@ -17,6 +18,14 @@ log.setLevel(logging.WARNING)
 recorder = get_recorder(__file__)
 
 
+@pytest.fixture(scope='module')
+def nam_cat():
+    """Parse the NAM CONUS 20km catalog once for the tests that only inspect it."""
+    with recorder.use_cassette('top_level_20km_rap_catalog'):
+        return TDSCatalog('http://thredds.ucar.edu/thredds/catalog/grib/NCEP/NAM/'
+                          'CONUS_20km/noaaport/catalog.xml')
+
+
 @recorder.use_cassette('thredds-test-toplevel-catalog')
 def test_basic():
     """Test of parsing a basic catalog."""
@@ -44,6 +53,16 @@ def test_catalog_session():
     cat.session.close()
 
 
+@recorder.use_cassette('thredds-test-toplevel-catalog')
+def test_catalog_shared_session():
+    """Test that a catalog uses a session passed in."""
+    url = 'http://thredds-test.unidata.ucar.edu/thredds/catalog.xml'
+    session = session_manager.create_session()
+    cat = TDSCatalog(url, session=session)
+    assert cat.session is session
+    assert 'Forecast Model Data' in cat.catalog_refs
+
+
 @recorder.use_cassette('thredds-test-latest-gfs-0p5')
 def test_access():
     """Test catalog parsing of access methods."""
@@ -63,14 +82,10 @@ def test_access_default_catalog():
     assert 'OPENDAP' in ds.access_urls
 
 
-@recorder.use_cassette('top_level_20km_rap_catalog')
-def test_virtual_access():
+def test_virtual_access(nam_cat):
     """Test access of virtual datasets."""
-    url = ('http://thredds.ucar.edu/thredds/catalog/grib/NCEP/NAM/'
-           'CONUS_20km/noaaport/catalog.xml')
-    cat = TDSCatalog(url)
     # find the 2D time coordinate "full collection" dataset
-    ds = cat.datasets['Full Collection (Reference / Forecast Time) Dataset']
+    ds = nam_cat.datasets['Full Collection (Reference / Forecast Time) Dataset']
     assert 'OPENDAP' in ds.access_urls
     # TwoD is a virtual dataset, so HTTPServer
     # should not be listed here
@@ -138,89 +153,66 @@ def test_catalog_follow():
     assert cat
 
 
-@recorder.use_cassette('top_level_20km_rap_catalog')
-def test_datasets_order():
+def test_datasets_order(nam_cat):
     """Test that we properly order datasets parsed from the catalog."""
-    url = ('http://thredds.ucar.edu/thredds/catalog/grib/NCEP/NAM/'
-           'CONUS_20km/noaaport/catalog.xml')
-    cat = TDSCatalog(url)
-    assert list(cat.datasets) == ['Full Collection (Reference / Forecast Time) Dataset',
-                                  'Best NAM CONUS 20km Time Series',
-                                  'Latest Collection for NAM CONUS 20km']
+    assert list(nam_cat.datasets) == ['Full Collection (Reference / Forecast Time) Dataset',
+                                      'Best NAM CONUS 20km Time Series',
+                                      'Latest Collection for NAM CONUS 20km']
 
 
-@recorder.use_cassette('top_level_20km_rap_catalog')
-def test_datasets_get_by_index():
+def test_datasets_get_by_index(nam_cat):
     """Test that datasets can be accessed by index."""
-    url = ('http://thredds.ucar.edu/thredds/catalog/grib/NCEP/NAM/'
-           'CONUS_20km/noaaport/catalog.xml')
-    cat = TDSCatalog(url)
-    assert cat.datasets[0].name == 'Full Collection (Reference / Forecast Time) Dataset'
-    assert cat.datasets[1].name == 'Best NAM CONUS 20km Time Series'
-    assert cat.datasets[2].name == 'Latest Collection for NAM CONUS 20km'
+    assert nam_cat.datasets[0].name == 'Full Collection (Reference / Forecast Time) Dataset'
+    assert nam_cat.datasets[1].name == 'Best NAM CONUS 20km Time Series'
+    assert nam_cat.datasets[2].name == 'Latest Collection for NAM CONUS 20km'
+
 
+def test_datasets_get_by_negative_index(nam_cat):
+    """Test that datasets can be accessed by negative index, and bad indices raise."""
+    assert nam_cat.datasets[-1].name == 'Latest Collection for NAM CONUS 20km'
+    assert nam_cat.datasets[-3].name == 'Full Collection (Reference / Forecast Time) Dataset'
+    with pytest.raises(IndexError):
+        nam_cat.datasets[3]
+    with pytest.raises(IndexError):
+        nam_cat.datasets[-4]
 
-@recorder.use_cassette('top_level_20km_rap_catalog')
-def test_datasets_str():
+
+def test_datasets_str(nam_cat):
     """Test that datasets are printed as expected."""
-    url = ('http://thredds.ucar.edu/thredds/catalog/grib/NCEP/NAM/'
-           'CONUS_20km/noaaport/catalog.xml')
-    cat = TDSCatalog(url)
-    assert str(cat.datasets) == ("['Full Collection (Reference / Forecast Time) Dataset', "
-                                 "'Best NAM CONUS 20km Time Series', "
-                                 "'Latest Collection for NAM CONUS 20km']")
+    assert str(nam_cat.datasets) == ("['Full Collection (Reference / Forecast Time) Dataset', "
+                                     "'Best NAM CONUS 20km Time Series', "
+                                     "'Latest Collection for NAM CONUS 20km']")
 
 
-@recorder.use_cassette('top_level_20km_rap_catalog')
-def test_datasets_sliced_str():
+def test_datasets_sliced_str(nam_cat):
     """Test that datasets are printed as expected when sliced."""
-    url = ('http://thredds.ucar.edu/thredds/catalog/grib/NCEP/NAM/'
-           'CONUS_20km/noaaport/catalog.xml')
-    cat = TDSCatalog(url)
-    assert str(cat.datasets[-2:]) == ('[Best NAM CONUS 20km Time Series, '
-                                      'Latest Collection for NAM CONUS 20km]')
+    assert str(nam_cat.datasets[-2:]) == ('[Best NAM CONUS 20km Time Series, '
+                                          'Latest Collection for NAM CONUS 20km]')
 
 
-@recorder.use_cassette('top_level_20km_rap_catalog')
-def test_datasets_nearest_time():
+def test_datasets_nearest_time(nam_cat):
     """Test getting dataset by time using filenames."""
-    url = ('http://thredds.ucar.edu/thredds/catalog/grib/NCEP/NAM/'
-           'CONUS_20km/noaaport/catalog.xml')
-    cat = TDSCatalog(url)
-    nearest = cat.catalog_refs.filter_time_nearest(datetime(2015, 5, 28, 17))
+    nearest = nam_cat.catalog_refs.filter_time_nearest(datetime(2015, 5, 28, 17))
     assert nearest.title == 'NAM_CONUS_20km_noaaport_20150528_1800.grib1'
 
 
-@recorder.use_cassette('top_level_20km_rap_catalog')
-def test_datasets_nearest_time_30():
+def test_datasets_nearest_time_30(nam_cat):
     """Test getting dataset by time; check for a day in the 30s (#gh-173)."""
-    url = ('http://thredds.ucar.edu/thredds/catalog/grib/NCEP/NAM/'
-           'CONUS_20km/noaaport/catalog.xml')
-    cat = TDSCatalog(url)
-    nearest = cat.catalog_refs.filter_time_nearest(datetime(2015, 5, 30, 11))
+    nearest = nam_cat.catalog_refs.filter_time_nearest(datetime(2015, 5, 30, 11))
     assert nearest.title == 'NAM_CONUS_20km_noaaport_20150530_1200.grib1'
 
 
-@recorder.use_cassette('top_level_20km_rap_catalog')
-def test_datasets_nearest_time_raises():
+def test_datasets_nearest_time_raises(nam_cat):
     """Test getting dataset by time using filenames."""
-    url = ('http://thredds.ucar.edu/thredds/catalog/grib/NCEP/NAM/'
-           'CONUS_20km/noaaport/catalog.xml')
-    cat = TDSCatalog(url)
-
     # Datasets doesn't have any timed datasets
     with pytest.raises(ValueError):
-        cat.datasets.filter_time_nearest(datetime(2015, 5, 28, 17))
+        nam_cat.datasets.filter_time_nearest(datetime(2015, 5, 28, 17))
 
 
-@recorder.use_cassette('top_level_20km_rap_catalog')
-def test_datasets_time_range():
+def test_datasets_time_range(nam_cat):
     """Test getting datasets by time range using filenames."""
-    url = ('http://thredds.ucar.edu/thredds/catalog/grib/NCEP/NAM/'
-           'CONUS_20km/noaaport/catalog.xml')
-    cat = TDSCatalog(url)
-    in_range = cat.catalog_refs.filter_time_range(datetime(2015, 5, 28, 0),
-                                                  datetime(2015, 5, 29, 0))
+    in_range = nam_cat.catalog_refs.filter_time_range(datetime(2015, 5, 28, 0),
+                                                      datetime(2015, 5, 29, 0))
     titles = [item.title for item in in_range]
     assert titles == ['NAM_CONUS_20km_noaaport_20150528_0000.grib1',
                       'NAM_CONUS_20km_noaaport_20150528_0600.grib1',
@@ -229,30 +221,22 @@ def test_datasets_time_range():
                       'NAM_CONUS_20km_noaaport_20150529_0000.grib1']
 
 
-@recorder.use_cassette('top_level_20km_rap_catalog')
-def test_datasets_bad_time_range():
+def test_datasets_bad_time_range(nam_cat):
     """Test warning message for bad time range."""
     with pytest.warns(UserWarning):
-        url = ('http://thredds.ucar.edu/thredds/catalog/grib/NCEP/NAM/'
-               'CONUS_20km/noaaport/catalog.xml')
-        cat = TDSCatalog(url)
-        in_range = cat.catalog_refs.filter_time_range(datetime(2015, 5, 29, 0),
-                                                      datetime(2015, 5, 28, 0))
+        in_range = nam_cat.catalog_refs.filter_time_range(datetime(2015, 5, 29, 0),
+                                                          datetime(2015, 5, 28, 0))
         assert in_range == []
 
 
-@recorder.use_cassette('top_level_20km_rap_catalog')
-def test_datasets_time_range_regex():
+def test_datasets_time_range_regex(nam_cat):
     """Test getting datasets by time range using filenames, with manual regex."""
     # This is DatasetCollection.default_regex, but tests passing it explicitly
-    regex = (r'(?P<year>\d{4})(?P<month>[01]\d)(?P<day>[0123]\d)_'
+    regex = (r'(?<!\d)(?P<year>\d{4})(?P<month>[01]\d)(?P<day>[0123]\d)_'
              r'(?P<hour>[012]\d)(?P<minute>[0-5]\d)')
-    url = ('http://thredds.ucar.edu/thredds/catalog/grib/NCEP/NAM/'
-           'CONUS_20km/noaaport/catalog.xml')
-    cat = TDSCatalog(url)
-    in_range = cat.catalog_refs.filter_time_range(datetime(2015, 5, 28, 0),
-                                                  datetime(2015, 5, 29, 0),
-                                                  regex=regex)
+    in_range = nam_cat.catalog_refs.filter_time_range(datetime(2015, 5, 28, 0),
+                                                      datetime(2015, 5, 29, 0),
+                                                      regex=regex)
     titles = [item.title for item in in_range]
     assert titles == ['NAM_CONUS_20km_noaaport_20150528_0000.grib1',
                       'NAM_CONUS_20km_noaaport_20150528_0600.grib1',
@@ -261,17 +245,13 @@ def test_datasets_time_range_regex():
                       'NAM_CONUS_20km_noaaport_20150529_0000.grib1']
 
 
-@recorder.use_cassette('top_level_20km_rap_catalog')
-def test_datasets_time_range_strptime():
+def test_datasets_time_range_strptime(nam_cat):
     """Test getting datasets by time range using filenames, with strptime."""
     regex = r'noaaport_(?P<strptime>\d{8}_\d{4})'
     strptime = '%Y%m%d_%H%M'
-    url = ('http://thredds.ucar.edu/thredds/catalog/grib/NCEP/NAM/'
-           'CONUS_20km/noaaport/catalog.xml')
-    cat = TDSCatalog(url)
-    in_range = cat.catalog_refs.filter_time_range(datetime(2015, 5, 28, 0),
-                                                  datetime(2015, 5, 29, 0),
-                                                  regex=regex, strptime=strptime)
+    in_range = nam_cat.catalog_refs.filter_time_range(datetime(2015, 5, 28, 0),
+                                                      datetime(2015, 5, 29, 0),
+                                                      regex=regex, strptime=strptime)
     titles = [item.title for item in in_range]
     assert titles == ['NAM_CONUS_20km_noaaport_20150528_0000.grib1',
                       'NAM_CONUS_20km_noaaport_20150528_0600.grib1',
@@ -280,16 +260,57 @@ def test_datasets_time_range_strptime():
                       'NAM_CONUS_20km_noaaport_20150529_0000.grib1']
 
 
-@recorder.use_cassette('top_level_20km_rap_catalog')
-def test_datasets_time_range_raises():
-    """Test getting datasets by time range using filenames."""
-    url = ('http://thredds.ucar.edu/thredds/catalog/grib/NCEP/NAM/'
-           'CONUS_20km/noaaport/catalog.xml')
-    cat = TDSCatalog(url)
+def test_datasets_time_index_updates():
+    """Test that time filtering reflects changes made to the collection."""
+    coll = DatasetCollection()
+    coll['a_20150528_0000.nc'] = 'first'
+    coll['b_20150528_1200.nc'] = 'second'
+    coll['c_20150528_0000.nc'] = 'duplicate'
+    assert coll.filter_time_nearest(datetime(2015, 5, 28, 2)) == 'first'
+    assert coll.filter_time_nearest(datetime(2015, 5, 28, 6)) == 'first'
+    assert coll.filter_time_range(datetime(2015, 5, 28), datetime(2015, 5, 29)) == [
+        'first', 'second', 'duplicate']
+
+    del coll['a_20150528_0000.nc']
+    coll['d_20150528_0500.nc'] = 'new'
+    assert coll.filter_time_nearest(datetime(2015, 5, 28, 2)) == 'duplicate'
+    assert coll.filter_time_nearest(datetime(2015, 5, 28, 6)) == 'new'
+    assert coll.filter_time_range(datetime(2015, 5, 28, 1), datetime(2015, 5, 29)) == [
+        'second', 'new']
+
+    assert coll.pop('c_20150528_0000.nc') == 'duplicate'
+    assert coll.filter_time_nearest(datetime(2015, 5, 28, 2)) == 'new'
+
+    assert coll.popitem(last=False) == ('b_20150528_1200.nc', 'second')
+    assert coll.filter_time_nearest(datetime(2015, 5, 28, 12)) == 'new'
+
+    coll['e_20150528_0600.nc'] = 'later'
+    assert coll.filter_time_range(datetime(2015, 5, 28), datetime(2015, 5, 29)) == [
+        'new', 'later']
+    coll.move_to_end('d_20150528_0500.nc')
+    assert coll.filter_time_range(datetime(2015, 5, 28), datetime(2015, 5, 29)) == [
+        'later', 'new']
+
+    coll.setdefault('f_20150528_0700.nc', 'default')
+    assert coll.filter_time_nearest(datetime(2015, 5, 28, 8)) == 'default'
+
+
+def test_datasets_default_regex_digit_run():
+    """Test that the default regex does not find dates inside a longer run of digits."""
+    coll = DatasetCollection()
+    coll['ens_123420150528_0000.nc'] = 'member'
+    with pytest.raises(ValueError):
+        coll.filter_time_nearest(datetime(2015, 5, 28))
 
+    coll['ens_1234_20150528_0600.nc'] = 'dated'
+    assert coll.filter_time_nearest(datetime(2015, 5, 28)) == 'dated'
+
+
+def test_datasets_time_range_raises(nam_cat):
+    """Test getting datasets by time range using filenames."""
     # No time-based dataset names
     with pytest.raises(ValueError):
-        cat.datasets.filter_time_range(datetime(2015, 5, 28, 0), datetime(2015, 5, 29, 0))
+        nam_cat.datasets.filter_time_range(datetime(2015, 5, 28, 0), datetime(2015, 5, 29, 0))
 
 
 @recorder.use_cassette('top_level_cat')
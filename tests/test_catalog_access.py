@@ -100,11 +100,26 @@ def test_dataset_download(nids_url):
     try:
         assert not os.path.exists(temp)
         cat.datasets[0].download(temp)
-        assert os.path.exists(temp)
+        assert os.path.getsize(temp) == 165
     finally:
         os.remove(temp)
 
 
+@recorder.use_cassette('cat_to_open')
+def test_dataset_download_failure(nids_url, tmp_path, monkeypatch):
+    """Test that a download failing partway through does not leave a partial file."""
+    def broken_copy(infile, outfile, length):
+        outfile.write(infile.read(10))
+        raise OSError('Connection lost')
+
+    monkeypatch.setattr('siphon.catalog.shutil.copyfileobj', broken_copy)
+    cat = TDSCatalog(nids_url)
+    temp = tmp_path / 'siphon-test.temp'
+    with pytest.raises(OSError, match='Connection lost'):
+        cat.datasets[0].download(temp)
+    assert not temp.exists()
+
+
 @recorder.use_cassette('cat_to_open')
 def test_dataset_default_download(nids_url):
     """Test using the download method using default filename."""
@@ -139,6 +154,17 @@ def test_dataset_invalid_service_subset(nids_url):
     assert 'not a valid service for' in str(err.value)
 
 
+@recorder.use_cassette('cat_to_open')
+def test_dataset_subset_service_names(nids_url):
+    """Test that subset validates against the dataset's NCSS service names."""
+    cat = TDSCatalog(nids_url)
+    ds = cat.datasets[0]
+    ds.ncss_service_names = ('NetcdfSubset',)
+    with pytest.raises(ValueError) as err:
+        ds.subset('netcdfserver')
+    assert 'Options are: NetcdfSubset' in str(err.value)
+
+
 @recorder.use_cassette('cat_to_open')
 def test_dataset_subset_unavailable(nids_url):
     """Test requesting subset on a dataset that does not have it gives a RuntimeError."""
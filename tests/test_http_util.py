@@ -4,6 +4,7 @@
 """Test Siphon's base HTTP helper functionality."""
 
 from datetime import datetime, timedelta
+import threading
 
 import pytest
 
@@ -13,6 +14,8 @@ import siphon.testing
 
 recorder = siphon.testing.get_recorder(__file__)
 
+query_time = datetime(2020, 1, 1, 12)
+
 
 @recorder.use_cassette('top_thredds_catalog')
 def test_urlopen():
@@ -21,6 +24,38 @@ def test_urlopen():
     assert fobj.read(2) == b'<?'
 
 
+@recorder.use_cassette('top_thredds_catalog')
+def test_urlopen_stream():
+    """Test siphon's urlopen wrapper when streaming the content."""
+    fobj = session_manager.urlopen('http://thredds-test.unidata.ucar.edu/thredds/catalog.xml',
+                                   stream=True)
+    try:
+        assert fobj.read(2) == b'<?'
+    finally:
+        fobj.close()
+
+
+def test_urlopen_session_reuse():
+    """Test that urlopen reuses its session until session settings change."""
+    session = session_manager._get_session()
+    assert session_manager._get_session() is session
+    session_manager.set_session_options(auth=('foo', 'bar'))
+    try:
+        assert session_manager._get_session() is not session
+        assert session_manager._get_session().auth == ('foo', 'bar')
+    finally:
+        session_manager.set_session_options()
+
+
+def test_urlopen_session_per_thread():
+    """Test that each thread gets its own urlopen session."""
+    sessions = []
+    thread = threading.Thread(target=lambda: sessions.append(session_manager._get_session()))
+    thread.start()
+    thread.join()
+    assert sessions[0] is not session_manager._get_session()
+
+
 @recorder.use_cassette('top_thredds_catalog')
 def test_session():
     """Test that http sessions contain the proper user agent."""
@@ -29,6 +64,16 @@ def test_session():
     assert resp.request.headers['user-agent'].startswith('Siphon')
 
 
+def test_session_pooling():
+    """Test that http sessions pool connections and retry gateway errors."""
+    session = session_manager.create_session()
+    for url in ('http://thredds.ucar.edu/', 'https://thredds.ucar.edu/'):
+        retries = session.get_adapter(url).max_retries
+        assert retries.total == 3
+        assert retries.is_retry('GET', 503)
+        assert not retries.is_retry('GET', 404)
+
+
 @recorder.use_cassette('top_thredds_catalog')
 def test_session_options():
     """Test that http sessions receive proper options."""
@@ -48,6 +93,20 @@ def test_parse_iso():
     assert parsed == datetime(2015, 6, 15, 12, tzinfo=utc)
 
 
+def test_parse_iso_not_padded():
+    """Test parsing ISO-formatted dates without zero-padding."""
+    assert parse_iso_date('2015-6-5T02:00:00Z') == datetime(2015, 6, 5, 2, tzinfo=utc)
+
+
+@pytest.mark.parametrize('date_str', ['2015-06-31T12:00:00Z', '2015-06-15T 1:00:00Z',
+                                      '2015-06-15T+1:00:00Z',
+                                      '2015-06-15T\u0661\u0662:00:00Z'])
+def test_parse_iso_invalid(date_str):
+    """Test that parsing invalid ISO-formatted dates raises."""
+    with pytest.raises(ValueError):
+        parse_iso_date(date_str)
+
+
 def test_data_query_basic():
     """Test forming a basic query."""
     dr = DataQuery()
@@ -71,7 +130,7 @@ def test_data_query_repeated_vars():
 
 def test_data_query_time_reset():
     """Test query with multiple time-type query fields."""
-    dr = DataQuery().all_times().time(datetime.now())
+    dr = DataQuery().all_times().time(query_time)
     query = str(dr)
     assert query.startswith('time='), 'Bad string: ' + query
     assert query.count('=') == 1
@@ -79,7 +138,7 @@ def test_data_query_time_reset():
 
 def test_data_query_time_reset2():
     """Test that time queries replace each other."""
-    dr = DataQuery().time(datetime.now()).all_times()
+    dr = DataQuery().time(query_time).all_times()
     assert str(dr) == 'temporal=all'
 
 
@@ -132,7 +191,7 @@ def test_data_query_spatial_reset2():
 
 def test_data_query_iter():
     """Test converting a query to a dictionary."""
-    dt = datetime.now()
+    dt = query_time
     dr = DataQuery().time(dt).lonlat_point(-1, -2)
     d = dict(dr)
 
@@ -143,7 +202,7 @@ def test_data_query_iter():
 
 def test_data_query_items():
     """Test the items method of query."""
-    dt = datetime.now()
+    dt = query_time
     dr = DataQuery().time(dt).lonlat_point(-1, -2)
     items = list(dr.items())
 
@@ -176,6 +235,19 @@ def endpoint():
                         'thredds/metadata/grib/NCEP/GFS/Global_0p5deg/TwoD')
 
 
+@recorder.use_cassette('gfs-metadata-map')
+def test_shared_session():
+    """Test that an endpoint makes requests using a session passed in."""
+    session = session_manager.create_session()
+    endpoint = HTTPEndPoint('http://thredds.ucar.edu/'
+                            'thredds/metadata/grib/NCEP/GFS/Global_0p5deg/TwoD',
+                            session=session)
+    q = endpoint.query().add_query_parameter(metadata='variableMap')
+    resp = endpoint.get_query(q)
+    assert resp.content
+    assert endpoint._session is session
+
+
 def test_basic(endpoint):
     """Test creating a basic query and validating it."""
     q = endpoint.query()
@@ -215,3 +287,10 @@ def test_url_path(endpoint):
     path = endpoint.url_path('foobar.html')
     assert path == ('http://thredds.ucar.edu/thredds/metadata/grib/NCEP/GFS/Global_0p5deg/TwoD'
                     '/foobar.html')
+
+
+def test_url_path_trailing_slash():
+    """Test forming url paths from an end point with a trailing slash."""
+    endpoint = HTTPEndPoint('http://thredds.ucar.edu/thredds/')
+    assert endpoint.url_path('catalog.xml') == 'http://thredds.ucar.edu/thredds/catalog.xml'
+    assert endpoint.url_path('/catalog.xml') == '/catalog.xml'
@@ -5,7 +5,6 @@
 
 from datetime import datetime
 
-from numpy.testing import assert_almost_equal
 import pytest
 
 from siphon.simplewebservice.iastate import IAStateUpperAir
@@ -22,14 +21,15 @@ def test_iastate():
     assert df['time'][0] == datetime(1999, 5, 4, 0)
     assert df['station'][0] == 'KOUN'
 
-    assert_almost_equal(df['pressure'][6], 872.7, 2)
-    assert_almost_equal(df['height'][6], 1172.0, 2)
-    assert_almost_equal(df['temperature'][6], 18.2, 2)
-    assert_almost_equal(df['dewpoint'][6], 15.1, 2)
-    assert_almost_equal(df['u_wind'][6], 4.631, 2)
-    assert_almost_equal(df['v_wind'][6], 37.716, 2)
-    assert_almost_equal(df['speed'][6], 38.0, 1)
-    assert_almost_equal(df['direction'][6], 187.0, 1)
+    row = df.iloc[6]
+    assert row['pressure'] == pytest.approx(872.7, abs=1.5e-2)
+    assert row['height'] == pytest.approx(1172.0, abs=1.5e-2)
+    assert row['temperature'] == pytest.approx(18.2, abs=1.5e-2)
+    assert row['dewpoint'] == pytest.approx(15.1, abs=1.5e-2)
+    assert row['u_wind'] == pytest.approx(4.631, abs=1.5e-2)
+    assert row['v_wind'] == pytest.approx(37.716, abs=1.5e-2)
+    assert row['speed'] == pytest.approx(38.0, abs=1.5e-1)
+    assert row['direction'] == pytest.approx(187.0, abs=1.5e-1)
 
     assert df.units['pressure'] == 'hPa'
     assert df.units['height'] == 'meter'
@@ -51,14 +51,15 @@ def test_high_alt_iastate():
     assert df['time'][0] == datetime(2010, 12, 9, 12)
     assert df['station'][0] == 'KBOI'
 
-    assert_almost_equal(df['pressure'][0], 919.0, 2)
-    assert_almost_equal(df['height'][0], 871.0, 2)
-    assert_almost_equal(df['temperature'][0], -0.1, 2)
-    assert_almost_equal(df['dewpoint'][0], -0.2, 2)
-    assert_almost_equal(df['u_wind'][0], 2.598, 2)
-    assert_almost_equal(df['v_wind'][0], 1.500, 2)
-    assert_almost_equal(df['speed'][0], 3.0, 1)
-    assert_almost_equal(df['direction'][0], 240.0, 1)
+    row = df.iloc[0]
+    assert row['pressure'] == pytest.approx(919.0, abs=1.5e-2)
+    assert row['height'] == pytest.approx(871.0, abs=1.5e-2)
+    assert row['temperature'] == pytest.approx(-0.1, abs=1.5e-2)
+    assert row['dewpoint'] == pytest.approx(-0.2, abs=1.5e-2)
+    assert row['u_wind'] == pytest.approx(2.598, abs=1.5e-2)
+    assert row['v_wind'] == pytest.approx(1.500, abs=1.5e-2)
+    assert row['speed'] == pytest.approx(3.0, abs=1.5e-1)
+    assert row['direction'] == pytest.approx(240.0, abs=1.5e-1)
 
     assert df.units['pressure'] == 'hPa'
     assert df.units['height'] == 'meter'
@@ -103,14 +104,15 @@ def test_all_data_single_pressure_iastate():
     assert df['time'][idx] == datetime(1999, 5, 4, 0)
     assert df['station'][idx] == 'KDDC'
 
-    assert_almost_equal(df['pressure'][idx], 500.0, 2)
-    assert_almost_equal(df['height'][idx], 5606.0, 2)
-    assert_almost_equal(df['temperature'][idx], -17.2, 2)
-    assert_almost_equal(df['dewpoint'][idx], -22.9, 2)
-    assert_almost_equal(df['u_wind'][idx], 30.834774, 2)
-    assert_almost_equal(df['v_wind'][idx], 35.47135, 2)
-    assert_almost_equal(df['speed'][idx], 47.0, 1)
-    assert_almost_equal(df['direction'][idx], 221.0, 1)
+    row = df.loc[idx]
+    assert row['pressure'] == pytest.approx(500.0, abs=1.5e-2)
+    assert row['height'] == pytest.approx(5606.0, abs=1.5e-2)
+    assert row['temperature'] == pytest.approx(-17.2, abs=1.5e-2)
+    assert row['dewpoint'] == pytest.approx(-22.9, abs=1.5e-2)
+    assert row['u_wind'] == pytest.approx(30.834774, abs=1.5e-2)
+    assert row['v_wind'] == pytest.approx(35.47135, abs=1.5e-2)
+    assert row['speed'] == pytest.approx(47.0, abs=1.5e-1)
+    assert row['direction'] == pytest.approx(221.0, abs=1.5e-1)
 
     assert df.units['pressure'] == 'hPa'
     assert df.units['height'] == 'meter'
@@ -133,14 +135,15 @@ def test_all_data_all_levels_iastate():
     assert df['time'][idx] == datetime(1999, 5, 4, 0)
     assert df['station'][idx] == 'KDDC'
 
-    assert_almost_equal(df['pressure'][idx], 700.0, 2)
-    assert_almost_equal(df['height'][idx], 2969.0, 2)
-    assert_almost_equal(df['temperature'][idx], 5.8, 2)
-    assert_almost_equal(df['dewpoint'][idx], -11.7, 2)
-    assert_almost_equal(df['u_wind'][idx], 33.234, 2)
-    assert_almost_equal(df['v_wind'][idx], 33.234, 2)
-    assert_almost_equal(df['speed'][idx], 47.0, 1)
-    assert_almost_equal(df['direction'][idx], 225.0, 1)
+    row = df.loc[idx]
+    assert row['pressure'] == pytest.approx(700.0, abs=1.5e-2)
+    assert row['height'] == pytest.approx(2969.0, abs=1.5e-2)
+    assert row['temperature'] == pytest.approx(5.8, abs=1.5e-2)
+    assert row['dewpoint'] == pytest.approx(-11.7, abs=1.5e-2)
+    assert row['u_wind'] == pytest.approx(33.234, abs=1.5e-2)
+    assert row['v_wind'] == pytest.approx(33.234, abs=1.5e-2)
+    assert row['speed'] == pytest.approx(47.0, abs=1.5e-1)
+    assert row['direction'] == pytest.approx(225.0, abs=1.5e-1)
 
     assert df.units['pressure'] == 'hPa'
     assert df.units['height'] == 'meter'
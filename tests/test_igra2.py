@@ -5,7 +5,6 @@
 
 from datetime import datetime
 
-from numpy.testing import assert_almost_equal
 import pytest
 
 from siphon.simplewebservice.igra2 import IGRAUpperAir
@@ -62,21 +61,22 @@ def test_igra2():
     """Test that we are properly parsing data from the IGRA2 archive."""
     df, _header = IGRAUpperAir.request_data(datetime(2010, 6, 1, 12), 'USM00070026')
 
-    assert_almost_equal(df['lvltyp1'][5], 1, 1)
-    assert_almost_equal(df['lvltyp2'][5], 0, 1)
-    assert_almost_equal(df['etime'][5], 126, 2)
-    assert_almost_equal(df['pressure'][5], 925.0, 2)
-    assert_almost_equal(df['pflag'][5], 0, 1)
-    assert_almost_equal(df['height'][5], 696., 2)
-    assert_almost_equal(df['zflag'][5], 2, 1)
-    assert_almost_equal(df['temperature'][5], -3.2, 2)
-    assert_almost_equal(df['tflag'][5], 2, 1)
-    assert_almost_equal(df['relative_humidity'][5], 96.3, 2)
-    assert_almost_equal(df['direction'][5], 33.0, 2)
-    assert_almost_equal(df['speed'][5], 8.2, 2)
-    assert_almost_equal(df['u_wind'][5], -4.5, 2)
-    assert_almost_equal(df['v_wind'][5], -6.9, 2)
-    assert_almost_equal(df['dewpoint'][5], -3.7, 2)
+    row = df.iloc[5]
+    assert row['lvltyp1'] == pytest.approx(1, abs=1.5e-1)
+    assert row['lvltyp2'] == pytest.approx(0, abs=1.5e-1)
+    assert row['etime'] == pytest.approx(126, abs=1.5e-2)
+    assert row['pressure'] == pytest.approx(925.0, abs=1.5e-2)
+    assert row['pflag'] == pytest.approx(0, abs=1.5e-1)
+    assert row['height'] == pytest.approx(696., abs=1.5e-2)
+    assert row['zflag'] == pytest.approx(2, abs=1.5e-1)
+    assert row['temperature'] == pytest.approx(-3.2, abs=1.5e-2)
+    assert row['tflag'] == pytest.approx(2, abs=1.5e-1)
+    assert row['relative_humidity'] == pytest.approx(96.3, abs=1.5e-2)
+    assert row['direction'] == pytest.approx(33.0, abs=1.5e-2)
+    assert row['speed'] == pytest.approx(8.2, abs=1.5e-2)
+    assert row['u_wind'] == pytest.approx(-4.5, abs=1.5e-2)
+    assert row['v_wind'] == pytest.approx(-6.9, abs=1.5e-2)
+    assert row['dewpoint'] == pytest.approx(-3.7, abs=1.5e-2)
 
     assert df.units['pressure'] == 'hPa'
     assert df.units['height'] == 'meter'
@@ -96,25 +96,26 @@ def test_igra2_drvd():
     df, _header = IGRAUpperAir.request_data(datetime(2014, 9, 10, 0),
                                            'USM00070026', derived=True)
 
-    assert_almost_equal(df['pressure'][5], 947.43, 2)
-    assert_almost_equal(df['reported_height'][5], 610., 2)
-    assert_almost_equal(df['calculated_height'][5], 610., 2)
-    assert_almost_equal(df['temperature'][5], 269.1, 2)
-    assert_almost_equal(df['temperature_gradient'][5], 0.0, 2)
-    assert_almost_equal(df['potential_temperature'][5], 273.2, 2)
-    assert_almost_equal(df['potential_temperature_gradient'][5], 11.0, 2)
-    assert_almost_equal(df['virtual_temperature'][5], 269.5, 2)
-    assert_almost_equal(df['virtual_potential_temperature'][5], 273.7, 2)
-    assert_almost_equal(df['vapor_pressure'][5], 4.268, 2)
-    assert_almost_equal(df['saturation_vapor_pressure'][5], 4.533, 2)
-    assert_almost_equal(df['reported_relative_humidity'][5], 93.9, 2)
-    assert_almost_equal(df['calculated_relative_humidity'][5], 94.1, 2)
-    assert_almost_equal(df['relative_humidity_gradient'][5], -75.3, 2)
-    assert_almost_equal(df['u_wind'][5], -7.8, 2)
-    assert_almost_equal(df['u_wind_gradient'][5], 9.6, 2)
-    assert_almost_equal(df['v_wind'][5], -1.2, 2)
-    assert_almost_equal(df['v_wind_gradient'][5], 2.7, 2)
-    assert_almost_equal(df['refractive_index'][5], 295., 2)
+    row = df.iloc[5]
+    assert row['pressure'] == pytest.approx(947.43, abs=1.5e-2)
+    assert row['reported_height'] == pytest.approx(610., abs=1.5e-2)
+    assert row['calculated_height'] == pytest.approx(610., abs=1.5e-2)
+    assert row['temperature'] == pytest.approx(269.1, abs=1.5e-2)
+    assert row['temperature_gradient'] == pytest.approx(0.0, abs=1.5e-2)
+    assert row['potential_temperature'] == pytest.approx(273.2, abs=1.5e-2)
+    assert row['potential_temperature_gradient'] == pytest.approx(11.0, abs=1.5e-2)
+    assert row['virtual_temperature'] == pytest.approx(269.5, abs=1.5e-2)
+    assert row['virtual_potential_temperature'] == pytest.approx(273.7, abs=1.5e-2)
+    assert row['vapor_pressure'] == pytest.approx(4.268, abs=1.5e-2)
+    assert row['saturation_vapor_pressure'] == pytest.approx(4.533, abs=1.5e-2)
+    assert row['reported_relative_humidity'] == pytest.approx(93.9, abs=1.5e-2)
+    assert row['calculated_relative_humidity'] == pytest.approx(94.1, abs=1.5e-2)
+    assert row['relative_humidity_gradient'] == pytest.approx(-75.3, abs=1.5e-2)
+    assert row['u_wind'] == pytest.approx(-7.8, abs=1.5e-2)
+    assert row['u_wind_gradient'] == pytest.approx(9.6, abs=1.5e-2)
+    assert row['v_wind'] == pytest.approx(-1.2, abs=1.5e-2)
+    assert row['v_wind_gradient'] == pytest.approx(2.7, abs=1.5e-2)
+    assert row['refractive_index'] == pytest.approx(295., abs=1.5e-2)
 
     assert df.units['pressure'] == 'hPa'
     assert df.units['reported_height'] == 'meter'
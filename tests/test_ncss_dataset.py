@@ -297,12 +297,12 @@ class TestSimpleTypes:
         expected = {'name': 'Temperature_isobaric',
                     'desc': 'Temperature @ Isobaric surface',
                     'shape': 'time1 isobaric3 y x',
+                    'type': 'float',
                     'attributes': {'units': 'K',
                                    'missing_value': [-999.9],
                                    'Grib2_Parameter': [0, 0, 0]}}
         actual = self.types.handle_grid(element)
-        assert expected['attributes'] == actual['attributes']
-        assert expected.pop('attributes', None) == actual.pop('attributes', None)
+        assert expected == actual
 
     def test_parameter(self):
         """Test parsing a parameter tag."""
@@ -344,6 +344,13 @@ class TestSimpleTypes:
         actual = self.types.handle_variable(element)
         assert expected == actual
 
+    def test_lookup(self, caplog):
+        """Test looking up handlers by element name."""
+        assert self.types.lookup('{http://www.unidata.ucar.edu}axisRef') == \
+            self.types.handle_axisRef
+        assert self.types.lookup('foo') is None
+        assert 'cannot find handler for element handle_foo' in caplog.text
+
 
 def test_dataset_elements_axis():
     """Test parsing an axis from a dataset element."""
@@ -7,6 +7,8 @@ from datetime import datetime
 
 import numpy as np
 from numpy.testing import assert_almost_equal, assert_equal
+import pandas as pd
+from pandas.testing import assert_series_equal
 import pytest
 
 from siphon.http_util import utc
@@ -231,44 +233,29 @@ def test_ndbc_latest():
     """Test that we are properly parsing latest NDBC observations."""
     df = NDBC.latest_observations()
 
-    assert df['station'][10] == '41004'
-    assert_almost_equal(df['latitude'][10], 32.501, 3)
-    assert_almost_equal(df['longitude'][10], -79.0989, 3)
-
-    assert_almost_equal(df['wind_direction'][10], 200.0, 1)
-    assert_almost_equal(df['wind_speed'][10], 5.0, 1)
-    assert_almost_equal(df['wind_gust'][10], 7.0, 1)
-    assert_equal(df['wave_height'][10], np.nan)
-    assert_equal(df['dominant_wave_period'][10], np.nan)
-    assert_equal(df['average_wave_period'][10], np.nan)
-    assert_equal(df['dominant_wave_direction'][10], np.nan)
-    assert_almost_equal(df['pressure'][10], 1016.9, 1)
-    assert_almost_equal(df['air_temperature'][10], 28.1, 1)
-    assert_almost_equal(df['water_temperature'][10], 28.8, 1)
-    assert_almost_equal(df['dewpoint'][10], 25.9, 1)
-    assert_equal(df['visibility'][10], np.nan)
-    assert_equal(df['3hr_pressure_tendency'][10], np.nan)
-    assert_equal(df['water_level_above_mean'][10], np.nan)
-    assert df['time'][10] == datetime(2018, 7, 30, 21, 10, tzinfo=utc)
-
-    assert df.units['station'] is None
-    assert df.units['latitude'] == 'degrees'
-    assert df.units['longitude'] == 'degrees'
-    assert df.units['wind_direction'] == 'degrees'
-    assert df.units['wind_speed'] == 'meters/second'
-    assert df.units['wind_gust'] == 'meters/second'
-    assert df.units['wave_height'] == 'meters'
-    assert df.units['dominant_wave_period'] == 'seconds'
-    assert df.units['average_wave_period'] == 'seconds'
-    assert df.units['dominant_wave_direction'] == 'degrees'
-    assert df.units['pressure'] == 'hPa'
-    assert df.units['air_temperature'] == 'degC'
-    assert df.units['water_temperature'] == 'degC'
-    assert df.units['dewpoint'] == 'degC'
-    assert df.units['visibility'] == 'nautical_mile'
-    assert df.units['3hr_pressure_tendency'] == 'hPa'
-    assert df.units['water_level_above_mean'] == 'feet'
-    assert df.units['time'] is None
+    row = df.iloc[10]
+    assert row['station'] == '41004'
+    assert row['time'] == datetime(2018, 7, 30, 21, 10, tzinfo=utc)
+
+    expected = pd.Series({'latitude': 32.501, 'longitude': -79.0989,
+                          'wind_direction': 200.0, 'wind_speed': 5.0, 'wind_gust': 7.0,
+                          'wave_height': np.nan, 'dominant_wave_period': np.nan,
+                          'average_wave_period': np.nan, 'dominant_wave_direction': np.nan,
+                          'pressure': 1016.9, 'air_temperature': 28.1,
+                          'water_temperature': 28.8, 'dewpoint': 25.9, 'visibility': np.nan,
+                          '3hr_pressure_tendency': np.nan, 'water_level_above_mean': np.nan})
+    assert_series_equal(row[expected.index].astype('float64'), expected, check_names=False,
+                        rtol=0, atol=1.5e-3)
+
+    assert df.units == {'station': None, 'latitude': 'degrees', 'longitude': 'degrees',
+                        'wind_direction': 'degrees', 'wind_speed': 'meters/second',
+                        'wind_gust': 'meters/second', 'wave_height': 'meters',
+                        'dominant_wave_period': 'seconds', 'average_wave_period': 'seconds',
+                        'dominant_wave_direction': 'degrees', 'pressure': 'hPa',
+                        'air_temperature': 'degC', 'water_temperature': 'degC',
+                        'dewpoint': 'degC', 'visibility': 'nautical_mile',
+                        '3hr_pressure_tendency': 'hPa', 'water_level_above_mean': 'feet',
+                        'time': None}
 
 
 @recorder.use_cassette('ndbc_buoy_data_types')
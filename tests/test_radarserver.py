@@ -8,11 +8,14 @@ from datetime import datetime
 import pytest
 from requests import HTTPError
 
+from siphon.http_util import session_manager
 from siphon.radarserver import BadQueryError, get_radarserver_datasets, RadarQuery, RadarServer
 import siphon.testing
 
 recorder = siphon.testing.get_recorder(__file__)
 
+query_time = datetime(2015, 6, 15, 12)
+
 
 def test_radar_query_one_station():
     """Test that radar query properly works when given a single station."""
@@ -30,14 +33,13 @@ def test_radar_query_multiple_stations():
 
 def test_radar_query_chain():
     """Test that radar query method calls can be chained."""
-    dt = datetime(2015, 6, 15, 12, 0, 0)
-    q = RadarQuery().stations('KFTG').time(dt)
+    q = RadarQuery().stations('KFTG').time(query_time)
     query = str(q)
     assert 'stn=KFTG' in query
     assert 'time=2015-06-15T12' in query
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 @recorder.use_cassette('thredds_radarserver_level3_metadata')
 def l3client():
     """Set up server and client for level 3 tests."""
@@ -58,7 +60,7 @@ def test_l3_invalid_variables(l3client):
     assert not l3client.validate_query(q)
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 @recorder.use_cassette('thredds_radarserver_metadata')
 def l2client():
     """Set up server and client for tests."""
@@ -99,18 +101,16 @@ def test_invalid_stations(l2client):
 
 def test_raw_catalog(l2client):
     """Test getting raw catalog bytes."""
-    dt = datetime(2015, 6, 15, 12, 0, 0)
     with recorder.use_cassette('thredds_radarserver_level2_single'):
-        q = l2client.query().stations('KFTG').time(dt)
+        q = l2client.query().stations('KFTG').time(query_time)
         cat = l2client.get_catalog_raw(q).strip()
     assert cat[-10:] == b'</catalog>'
 
 
 def test_good_query(l2client):
     """Test making a good request."""
-    dt = datetime(2015, 6, 15, 12, 0, 0)
     with recorder.use_cassette('thredds_radarserver_level2_single'):
-        q = l2client.query().stations('KFTG').time(dt)
+        q = l2client.query().stations('KFTG').time(query_time)
         cat = l2client.get_catalog(q)
     assert len(cat.datasets) == 1
 
@@ -118,9 +118,8 @@ def test_good_query(l2client):
 @recorder.use_cassette('thredds_radarserver_level3_bad')
 def test_bad_query_raises():
     """Test that a bad query raises an error."""
-    dt = datetime(2015, 6, 15, 12, 0, 0)
     client = RadarServer('http://thredds.ucar.edu/thredds/radarServer//nexrad/level3/IDD')
-    q = client.query().stations('FTG').time(dt)
+    q = client.query().stations('FTG').time(query_time)
     with pytest.raises(BadQueryError):
         client.get_catalog(q)
 
@@ -128,24 +127,30 @@ def test_bad_query_raises():
 @recorder.use_cassette('thredds_radarserver_level3_good')
 def test_good_level3_query():
     """Test that a valid level 3 query succeeds."""
-    dt = datetime(2015, 6, 15, 12, 0, 0)
     client = RadarServer('http://thredds.ucar.edu/thredds/radarServer//nexrad/level3/IDD/')
-    q = client.query().stations('FTG').time(dt).variables('N0Q')
+    q = client.query().stations('FTG').time(query_time).variables('N0Q')
     cat = client.get_catalog(q)
     assert len(cat.datasets) == 1
 
 
-@recorder.use_cassette('thredds_radarserver_toplevel')
-def test_datasets_no_trailing():
-    """Test that passing a url without a trailing slash works."""
-    ds = get_radarserver_datasets('http://thredds.ucar.edu/thredds')
-    assert len(ds) == 5
+@recorder.use_cassette('thredds_radarserver_level3_good')
+def test_shared_session():
+    """Test that a session passed in is used for the server and its catalogs."""
+    session = session_manager.create_session()
+    client = RadarServer('http://thredds.ucar.edu/thredds/radarServer//nexrad/level3/IDD/',
+                         session=session)
+    q = client.query().stations('FTG').time(query_time).variables('N0Q')
+    cat = client.get_catalog(q)
+    assert client._session is session
+    assert cat.session is session
 
 
+@pytest.mark.parametrize('url', ['http://thredds.ucar.edu/thredds',
+                                 'http://thredds.ucar.edu/thredds/'])
 @recorder.use_cassette('thredds_radarserver_toplevel')
-def test_datasets_trailing():
-    """Test that passing a url with a trailing slash works."""
-    ds = get_radarserver_datasets('http://thredds.ucar.edu/thredds/')
+def test_datasets_trailing(url):
+    """Test that passing a url with or without a trailing slash works."""
+    ds = get_radarserver_datasets(url)
     assert len(ds) == 5
 
 
@@ -0,0 +1,42 @@
+# Copyright (c) 2026 Siphon Contributors.
+# Distributed under the terms of the BSD 3-Clause License.
+# SPDX-License-Identifier: BSD-3-Clause
+"""Test the utilities for testing siphon."""
+
+import os.path
+import pickle
+import shutil
+
+from vcr.serializers import yamlserializer
+
+from siphon.testing import PickleCachePersister
+
+fixture = os.path.join(os.path.dirname(__file__), 'fixtures', 'top_thredds_catalog')
+
+
+def test_cassette_cache(tmp_path):
+    """Test that a parsed cassette is cached and reused."""
+    path = tmp_path / 'cassette'
+    shutil.copy(fixture, path)
+
+    requests, responses = PickleCachePersister.load_cassette(path, yamlserializer)
+    assert os.path.exists(f'{path}.pkl')
+
+    cached_requests, cached_responses = PickleCachePersister.load_cassette(path,
+                                                                           yamlserializer)
+    assert [r.uri for r in cached_requests] == [r.uri for r in requests]
+    assert cached_responses == responses
+
+
+def test_cassette_cache_write_failure(tmp_path, monkeypatch):
+    """Test that failing to write the cache still returns the cassette, leaving no files."""
+    def broken_dump(*args, **kwargs):
+        raise pickle.PicklingError('Cannot pickle')
+
+    path = tmp_path / 'cassette'
+    shutil.copy(fixture, path)
+    monkeypatch.setattr('siphon.testing.pickle.dump', broken_dump)
+
+    requests, responses = PickleCachePersister.load_cassette(path, yamlserializer)
+    assert requests and responses
+    assert os.listdir(tmp_path) == ['cassette']
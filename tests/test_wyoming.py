@@ -5,7 +5,6 @@
 
 from datetime import datetime
 
-from numpy.testing import assert_almost_equal
 import pandas as pd
 import pytest
 
@@ -27,15 +26,16 @@ def test_wyoming():
     assert df['longitude'][0] == -97.44
     assert df['elevation'][0] == 345.0
 
-    assert_almost_equal(df['pressure'][5], 867.9, 2)
-    assert_almost_equal(df['height'][5], 1219., 2)
-    assert_almost_equal(df['height'][30], 10505., 2)
-    assert_almost_equal(df['temperature'][5], 17.4, 2)
-    assert_almost_equal(df['dewpoint'][5], 14.3, 2)
-    assert_almost_equal(df['u_wind'][5], 6.60, 2)
-    assert_almost_equal(df['v_wind'][5], 37.42, 2)
-    assert_almost_equal(df['speed'][5], 38.0, 1)
-    assert_almost_equal(df['direction'][5], 190.0, 1)
+    row = df.iloc[5]
+    assert row['pressure'] == pytest.approx(867.9, abs=1.5e-2)
+    assert row['height'] == pytest.approx(1219., abs=1.5e-2)
+    assert df['height'][30] == pytest.approx(10505., abs=1.5e-2)
+    assert row['temperature'] == pytest.approx(17.4, abs=1.5e-2)
+    assert row['dewpoint'] == pytest.approx(14.3, abs=1.5e-2)
+    assert row['u_wind'] == pytest.approx(6.60, abs=1.5e-2)
+    assert row['v_wind'] == pytest.approx(37.42, abs=1.5e-2)
+    assert row['speed'] == pytest.approx(38.0, abs=1.5e-1)
+    assert row['direction'] == pytest.approx(190.0, abs=1.5e-1)
 
     assert df.units['pressure'] == 'hPa'
     assert df.units['height'] == 'meter'
@@ -66,15 +66,16 @@ def test_wyoming_recalculate():
     assert df['longitude'][0] == -97.44
     assert df['elevation'][0] == 345.0
 
-    assert_almost_equal(df['pressure'][5], 867.9, 2)
-    assert_almost_equal(df['height'][5], 1219., 2)
-    assert_almost_equal(df['height'][30], 10505., 2)
-    assert_almost_equal(df['temperature'][5], 17.4, 2)
-    assert_almost_equal(df['dewpoint'][5], 14.3, 2)
-    assert_almost_equal(df['u_wind'][5], 6.60, 2)
-    assert_almost_equal(df['v_wind'][5], 37.42, 2)
-    assert_almost_equal(df['speed'][5], 38.0, 1)
-    assert_almost_equal(df['direction'][5], 190.0, 1)
+    row = df.iloc[5]
+    assert row['pressure'] == pytest.approx(867.9, abs=1.5e-2)
+    assert row['height'] == pytest.approx(1219., abs=1.5e-2)
+    assert df['height'][30] == pytest.approx(10505., abs=1.5e-2)
+    assert row['temperature'] == pytest.approx(17.4, abs=1.5e-2)
+    assert row['dewpoint'] == pytest.approx(14.3, abs=1.5e-2)
+    assert row['u_wind'] == pytest.approx(6.60, abs=1.5e-2)
+    assert row['v_wind'] == pytest.approx(37.42, abs=1.5e-2)
+    assert row['speed'] == pytest.approx(38.0, abs=1.5e-1)
+    assert row['direction'] == pytest.approx(190.0, abs=1.5e-1)
 
     assert df.units['pressure'] == 'hPa'
     assert df.units['height'] == 'meter'
@@ -104,14 +105,15 @@ def test_wyoming_no_station():
     assert df['longitude'][0] == -93.9
     assert df['elevation'][0] == 438.0
 
-    assert_almost_equal(df['pressure'][5], 884.0, 2)
-    assert_almost_equal(df['height'][5], 1140, 2)
-    assert_almost_equal(df['temperature'][5], 14.6, 2)
-    assert_almost_equal(df['dewpoint'][5], 12.8, 2)
-    assert_almost_equal(df['u_wind'][5], -10.940, 2)
-    assert_almost_equal(df['v_wind'][5], 25.774, 2)
-    assert_almost_equal(df['speed'][5], 28.0, 1)
-    assert_almost_equal(df['direction'][5], 157.0, 1)
+    row = df.iloc[5]
+    assert row['pressure'] == pytest.approx(884.0, abs=1.5e-2)
+    assert row['height'] == pytest.approx(1140, abs=1.5e-2)
+    assert row['temperature'] == pytest.approx(14.6, abs=1.5e-2)
+    assert row['dewpoint'] == pytest.approx(12.8, abs=1.5e-2)
+    assert row['u_wind'] == pytest.approx(-10.940, abs=1.5e-2)
+    assert row['v_wind'] == pytest.approx(25.774, abs=1.5e-2)
+    assert row['speed'] == pytest.approx(28.0, abs=1.5e-1)
+    assert row['direction'] == pytest.approx(157.0, abs=1.5e-1)
 
     assert df.units['pressure'] == 'hPa'
     assert df.units['height'] == 'meter'
@@ -141,14 +143,15 @@ def test_high_alt_wyoming():
     assert df['longitude'][0] == -116.21
     assert df['elevation'][0] == 874.0
 
-    assert_almost_equal(df['pressure'][2], 890.0, 2)
-    assert_almost_equal(df['height'][2], 1133., 2)
-    assert_almost_equal(df['temperature'][2], 5.4, 2)
-    assert_almost_equal(df['dewpoint'][2], 3.9, 2)
-    assert_almost_equal(df['u_wind'][2], -0.42, 2)
-    assert_almost_equal(df['v_wind'][2], 5.99, 2)
-    assert_almost_equal(df['speed'][2], 6.0, 1)
-    assert_almost_equal(df['direction'][2], 176.0, 1)
+    row = df.iloc[2]
+    assert row['pressure'] == pytest.approx(890.0, abs=1.5e-2)
+    assert row['height'] == pytest.approx(1133., abs=1.5e-2)
+    assert row['temperature'] == pytest.approx(5.4, abs=1.5e-2)
+    assert row['dewpoint'] == pytest.approx(3.9, abs=1.5e-2)
+    assert row['u_wind'] == pytest.approx(-0.42, abs=1.5e-2)
+    assert row['v_wind'] == pytest.approx(5.99, abs=1.5e-2)
+    assert row['speed'] == pytest.approx(6.0, abs=1.5e-1)
+    assert row['direction'] == pytest.approx(176.0, abs=1.5e-1)
 
     assert df.units['pressure'] == 'hPa'
     assert df.units['height'] == 'meter'
@@ -178,8 +181,8 @@ def test_wyoming_heights():
     """Test that we are properly parsing height data from the Wyoming archive."""
     df = WyomingUpperAir.request_data(datetime(2023, 5, 22, 12), 'OUN')
 
-    assert_almost_equal(df['height'][140], 10336.0, 2)
-    assert_almost_equal(df['direction'][1], 145.0, 1)
+    assert df['height'][140] == pytest.approx(10336.0, abs=1.5e-2)
+    assert df['direction'][1] == pytest.approx(145.0, abs=1.5e-1)
 
 
 # GH #749